@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+import mmap
 import re
 import struct
 from dataclasses import dataclass, field
@@ -20,6 +21,25 @@ TEMPLATE_ICON_OFFSETS = {
 }
 
 
+def read_file_buffer(path: Path) -> "bytes | mmap.mmap":
+    """Open *path* as a read-only mmap buffer, falling back to a plain read.
+
+    Mapping gives the parsers zero-copy access to the raw file; empty files
+    (and filesystems that refuse mapping) cannot be mapped and are read
+    normally instead.
+    """
+    with open(path, "rb") as handle:
+        try:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return handle.read()
+    # The parsers walk these buffers front to back, so hint the kernel to
+    # read ahead aggressively. madvise is absent on Windows; skip it there.
+    if hasattr(buffer, "madvise"):
+        buffer.madvise(mmap.MADV_SEQUENTIAL)
+    return buffer
+
+
 def _read_word(data: bytes, offset: int) -> Tuple[int, int]:
     value = struct.unpack_from("<H", data, offset)[0]
     return value, offset + 2
@@ -41,6 +61,9 @@ class MetadataEntry:
         encoded = self.text.encode(SCENARIO_TEXT_ENCODING, errors="replace")
         return encoded + b"\x00" + (b"\x00" * self.extra_zero_count)
 
+    def clone(self) -> "MetadataEntry":
+        return MetadataEntry(self.text, self.extra_zero_count)
+
 
 @dataclass
 class ScenarioRecord:
@@ -124,16 +147,20 @@ class ScenarioFile:
 
     @classmethod
     def load(cls, path: Path) -> "ScenarioFile":
-        data = path.read_bytes()
+        return cls.load_from_buffer(read_file_buffer(path), path=path)
+
+    @classmethod
+    def load_from_buffer(
+        cls, data: "bytes | mmap.mmap", path: Optional[Path] = None
+    ) -> "ScenarioFile":
         count, offset = _read_word(data, 0)
         if count <= 0:
             return cls(path=path, records=[])
-        payload = data[offset:]
-        block_len = len(payload) // count
+        block_len = (len(data) - offset) // count
         records: List[ScenarioRecord] = []
         for idx in range(count):
-            start = idx * block_len
-            block = payload[start : start + block_len]
+            start = offset + idx * block_len
+            block = data[start : start + block_len]
             records.append(parse_scenario_block(block, index=idx))
         return cls(path=path, records=records)
 
@@ -553,7 +580,11 @@ class MapFile:
     regions: List[MapRegion]
     pointer_entries: List[PointerEntry]
     unit_tables: Dict[str, UnitTable]
-    pointer_blob: bytearray
+    # Pointer data region, copied out of the load buffer so the source
+    # file's mapping can be released (Windows refuses to rewrite a file
+    # that is still mapped); ``save`` copies it into a fresh bytearray
+    # before patching.
+    pointer_blob: bytes
     template_library: Dict[str, List[TemplateRecord]] = field(default_factory=dict)
     position_entries: List["PositionEntry"] = field(default_factory=list)
 
@@ -563,7 +594,7 @@ class MapFile:
 
     @classmethod
     def load(cls, path: Path, template_library: Optional[Dict[str, List[TemplateRecord]]] = None) -> "MapFile":
-        data = path.read_bytes()
+        data = read_file_buffer(path)
         region_count, offset = _read_word(data, 0)
         regions: List[MapRegion] = []
         cursor = offset
@@ -579,7 +610,7 @@ class MapFile:
             count, cursor = _read_word(data, pointer_table_offset + idx * 4 + 2)
             pointer_pairs.append((start, count))
         pointer_data_base = pointer_table_offset + 16 * 4
-        pointer_blob = bytearray(data[pointer_data_base:])
+        pointer_blob = bytes(data[pointer_data_base:])
         pointer_entries = []
 
         # Load templates from the map file's directory if not provided
@@ -659,6 +690,12 @@ class MapFile:
                 max_slots=len(entry.data) // UNIT_FRAME_SIZE,
             )
 
+        # Everything has been copied out of the buffer; drop the mapping now
+        # so saving back over the source file works on Windows, which fails
+        # writes to a file with an active user mapping.
+        if isinstance(data, mmap.mmap):
+            data.close()
+
         return cls(
             path=path,
             regions=regions,
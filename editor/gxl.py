@@ -6,15 +6,21 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
+from .data import read_file_buffer
+
 
 @dataclass
 class GXLEntry:
-    """An entry in a GXL archive."""
+    """An entry in a GXL archive.
+
+    ``data`` is a zero-copy view into the archive blob; wrap it in ``bytes()``
+    if an independent copy is needed.
+    """
 
     name: str
     offset: int
     size: int
-    data: bytes
+    data: memoryview
 
 
 def load_gxl_archive(path: Path) -> List[GXLEntry]:
@@ -27,7 +33,9 @@ def load_gxl_archive(path: Path) -> List[GXLEntry]:
     - Each entry: [metadata bytes] filename (null-terminated) offset (4 bytes LE) size (4 bytes LE)
     - Data follows directory
     """
-    blob = path.read_bytes()
+    blob = read_file_buffer(path)
+    # Entries hand out views into this blob rather than per-entry copies.
+    blob_view = memoryview(blob)
 
     entries: List[GXLEntry] = []
     pos = 0x80  # Skip copyright header
@@ -79,8 +87,8 @@ def load_gxl_archive(path: Path) -> List[GXLEntry]:
             pos = pcx_pos + 5
             continue
 
-        # Extract data
-        data = blob[offset:offset+size]
+        # Extract data without copying it out of the blob
+        data = blob_view[offset:offset+size]
 
         # Verify it starts with PCX magic bytes (0x0A = ZSoft PCX format)
         if len(data) > 0 and data[0] == 0x0A:
@@ -6,6 +6,8 @@ from typing import Dict, Iterable, List, Sequence, Tuple
 
 from PIL import Image
 
+from .data import read_file_buffer
+
 # EGA 16-colour palette (BGI default). Values are 0-255 RGB triples.
 EGA_PALETTE: Sequence[Tuple[int, int, int]] = (
     (0, 0, 0),  # 0 black
@@ -67,26 +69,29 @@ class MiconIcon:
         """
 
         width, height = self.width, self.height
-        img = Image.new("RGBA", (width, height))
         background_rgba: Tuple[int, int, int] | None = None
         if side is not None and side in TEAM_COLOURS:
             background_rgba = TEAM_COLOURS[side]
 
-        for y, row in enumerate(self.pixels):
-            for x, colour_index in enumerate(row):
-                if colour_index == 0:
-                    img.putpixel((x, y), (0, 0, 0, 0))
-                    continue
-
-                if (
-                    background_rgba is not None
-                    and colour_index == self.background_index
-                ):
-                    r, g, b = background_rgba
-                    img.putpixel((x, y), (r, g, b, 255))
-                else:
-                    base = palette[colour_index % len(palette)]
-                    img.putpixel((x, y), (*base, 255))
+        # Colour resolution only depends on the 4-bit index, so build a
+        # 16-entry RGBA lookup table up front and assemble the pixel buffer
+        # by joining table entries instead of issuing one putpixel call per
+        # pixel.
+        lut = [bytes((*palette[i % len(palette)], 255)) for i in range(16)]
+        lut[0] = b"\x00\x00\x00\x00"  # index 0 is transparent
+        if background_rgba is not None and self.background_index != 0:
+            lut[self.background_index] = bytes((*background_rgba, 255))
+
+        data = b"".join(lut[colour_index] for row in self.pixels for colour_index in row)
+        if len(data) == width * height * 4:
+            img = Image.frombytes("RGBA", (width, height), data)
+        else:
+            # Ragged pixel rows (truncated record); fall back to the slow
+            # per-pixel path, which tolerates short rows.
+            img = Image.new("RGBA", (width, height))
+            for y, row in enumerate(self.pixels):
+                for x, colour_index in enumerate(row):
+                    img.putpixel((x, y), tuple(lut[colour_index]))
 
         if scale > 1:
             img = img.resize((width * scale, height * scale), Image.NEAREST)
@@ -102,7 +107,7 @@ def load_micon_icons(path: Path) -> List[MiconIcon]:
     Borland's BGI ``getimage`` format (four bit-planes, little-endian, 16 colours).
     """
 
-    blob = path.read_bytes()
+    blob = read_file_buffer(path)
     icons: List[MiconIcon] = []
     search_pos = 0
     record_index = 0
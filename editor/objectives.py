@@ -92,30 +92,41 @@ def _locate_script_start(blob: bytes) -> Optional[int]:
     return None
 
 
-def objective_script_bytes(blob: bytes) -> bytes:
-    """Return the slice of *blob* that contains the objective script words."""
+def objective_script_offset(blob: bytes) -> Optional[int]:
+    """Return the byte offset of the objective script, or ``None`` if absent.
+
+    Useful when a caller only needs to know where the script begins (e.g. to
+    patch words in place) and would otherwise copy the whole tail just to
+    measure it.
+    """
     start = _locate_script_start(blob)
     if start is None or start >= len(blob):
+        return None
+    return start
+
+
+def objective_script_bytes(blob: bytes) -> bytes:
+    """Return the slice of *blob* that contains the objective script words."""
+    start = objective_script_offset(blob)
+    if start is None:
         return b""
     return blob[start:]
 
 
 def parse_objective_script(blob: bytes) -> List[Tuple[int, int]]:
     """Parse objective script words into (opcode, operand) tuples."""
-    script_data = objective_script_bytes(blob)
-    if len(script_data) < 2:
+    start = objective_script_offset(blob)
+    if start is None or len(blob) - start < 2:
         return []
 
-    # Ensure we only read full words.
-    if len(script_data) % 2 == 1:
-        script_data = script_data[:-1]
+    # Decode the whole (bounded) word region in one C-level unpack, then scan
+    # plain ints; this keeps the per-word Python work to a shift and a mask.
+    count = min(len(blob) - start, MAX_SCRIPT_WORDS * 2) // 2
+    words = struct.unpack_from("<%dH" % count, blob, start)
 
     script: List[Tuple[int, int]] = []
     consecutive_zeros = 0
-    limit = min(len(script_data), MAX_SCRIPT_WORDS * 2)
-    for offset in range(0, limit, 2):
-        word = struct.unpack_from("<H", script_data, offset)[0]
-
+    for word in words:
         # Count consecutive zeros - only stop after 2+ consecutive zeros
         # This allows END(0) opcode (0x0000) to be parsed as a section separator
         if word == 0:
@@ -125,8 +136,6 @@ def parse_objective_script(blob: bytes) -> List[Tuple[int, int]]:
         else:
             consecutive_zeros = 0
 
-        opcode = (word >> 8) & 0xFF
-        operand = word & 0xFF
-        script.append((opcode, operand))
+        script.append((word >> 8, word & 0xFF))
 
     return script
@@ -14,17 +14,24 @@ binary sections so that files can be round-tripped safely.
 
 from __future__ import annotations
 
-import struct
+import hashlib
+import io
+import re
+import sys
+from array import array
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-from PIL import ImageTk
+from PIL import Image, ImageDraw, ImageTk
 
 from editor.data import (
     MapFile,
+    PointerEntry,
     ScenarioFile,
     ScenarioRecord,
     TemplateRecord,
@@ -33,11 +40,11 @@ from editor.data import (
     load_template_library,
     MetadataEntry,
 )
-from editor.icons import MiconIcon, load_micon_icons
+from editor.icons import MiconIcon, TEAM_COLOURS, load_micon_icons
 from editor.gxl import load_gxl_archive
 from editor.objectives import (
     parse_objective_script as parse_objective_script_proper,
-    objective_script_bytes,
+    objective_script_offset,
 )
 
 try:
@@ -98,12 +105,41 @@ OPCODE_MAP = {
     0xbb: ("ZONE_ENTRY", "Zone idx", "Zone entry requirement (middle pos)"),
 }
 
+# Opcodes are single bytes, so a 256-slot tuple gives plain index lookup in
+# the per-word render loops instead of dict hashing. None marks unknown ops.
+OPCODE_TABLE = tuple(OPCODE_MAP.get(i) for i in range(256))
+
+# Preformatted (hex label, mnemonic, operand label) per opcode so the win
+# table does not rebuild the same strings on every refresh.
+_OPCODE_ROWS = tuple(
+    (f"0x{op:02x}",) + (OPCODE_MAP[op][:2] if op in OPCODE_MAP else (f"UNKNOWN_{op:02x}", "?"))
+    for op in range(256)
+)
+
 SPECIAL_OPERANDS = {
     0xfe: "PROHIBITED/ALL",
     0xff: "UNLIMITED",
     0x00: "NONE/STANDARD",
 }
 
+# Preformatted operand column text (operands are single bytes too), with the
+# special-value annotations baked in.
+_OPERAND_LABELS = tuple(
+    f"{value} ({SPECIAL_OPERANDS[value]})" if value in SPECIAL_OPERANDS else str(value)
+    for value in range(256)
+)
+
+# Banner strings shared by the objective renderers; defined once so both
+# emitters stay in sync (and reuse the same objects) instead of repeating
+# the literals inline.
+_SEP = "═" * 51
+_SEP_NL = _SEP + "\n"
+_HDR_OBJECTIVES = "SCENARIO OBJECTIVES (Descriptive Text)"
+_HDR_BINARY = "BINARY OPCODE IMPLEMENTATION"
+_GREEN_HEADER = "═══ GREEN PLAYER OBJECTIVES ═══"
+_RED_HEADER = "═══ RED PLAYER OBJECTIVES ═══"
+_GREEN_HEADER_NL = _GREEN_HEADER + "\n"
+_RED_HEADER_NL = _RED_HEADER + "\n"
 # STRATMAP.PCX contains two map insets embedded inside the scenario UI.
 # Each inset renders the scrolling MAPVER20 board inside a 256px viewport,
 # but the actual artwork is vertically offset within the PCX.
@@ -144,6 +180,19 @@ class ScenarioEditorApp:
         self.scenario_file: Optional[ScenarioFile] = None
         self.map_file: Optional[MapFile] = None
         self.map_file_path: Optional[Path] = None
+        # Set by every mutating handler, cleared on load and successful save;
+        # Save All skips files whose flag is clear instead of re-serializing
+        # identical bytes to disk.
+        self._scenario_dirty = False
+        self._map_dirty = False
+        # Resolved once at load time so scenario selection does not re-walk
+        # the filesystem comparing paths.
+        self._resolved_map_path: Optional[Path] = None
+        # Lowercased filename -> Path index of game_dir, built lazily so map
+        # lookups cost one dict get instead of per-candidate stat calls.
+        self._game_dir_index: Optional[Dict[str, Path]] = None
+        # Worker pool for decoding GXL previews off the Tk main thread.
+        self._image_executor = ThreadPoolExecutor(max_workers=2)
         self.template_library: Dict[str, List[TemplateRecord]] = {
             "air": [],
             "surface": [],
@@ -153,12 +202,69 @@ class ScenarioEditorApp:
         self.icon_library: List[MiconIcon] = []
         self.port_records: List[PortRecord] = []
         self._port_records_by_name: Dict[str, List[PortRecord]] = {}
+        # Objective ports per map identity; scanning the map file is costly and
+        # a single script can hit the 0x04/0x05 branches several times.
+        self._objective_ports_cache: Dict[int, List[str]] = {}
+        # Convoy ship names per map identity; the 0x05 and 0x18 branches both
+        # re-scan pointer section 14 otherwise.
+        self._convoy_ship_names_cache: Dict[int, List[str]] = {}
+        # Null-terminated string table from pointer section 9, parsed once per
+        # loaded map; the opcode decoders index into it repeatedly.
+        self._section9_strings_cache: Dict[int, List[str]] = {}
+        # Pointer entries by section index, rebuilt on map load so the
+        # extractors stop scanning the entry list per lookup.
+        self._pointer_entries_by_index: Dict[int, PointerEntry] = {}
+        # Region index -> name, cleared whenever a map is (re)loaded.
+        self._region_name_cache: Dict[int, str] = {}
+        # Template names per kind, rebuilt only when the template library is
+        # reloaded; the combobox values marshal into Tcl on every assignment.
+        self._template_names_cache: Dict[str, Tuple[str, ...]] = {}
+        # Parsed objective scripts keyed by trailing-bytes identity. Every edit
+        # assigns a fresh bytes object, so stale entries simply stop matching;
+        # the kept reference guards against id() reuse.
+        self._parsed_script_cache: Dict[int, Tuple[bytes, Tuple[Tuple[int, int], ...]]] = {}
+        # Fully decoded win-table rows, keyed the same way but also pinned to
+        # the map the descriptions were resolved against.
+        self._win_rows_cache: Dict[int, Tuple[bytes, int, List[tuple]]] = {}
+        # Script start offsets, keyed the same way; the locate scan is the
+        # expensive half of every word patch/re-encode.
+        self._script_offset_cache: Dict[int, Tuple[bytes, Optional[int]]] = {}
+        # Inputs behind the last decoded-objectives repaint (trailing bytes,
+        # objectives text, map identity); matching identities mean the widget
+        # already shows the right content.
+        self._decoded_render_key: Optional[Tuple[bytes, Optional[str], int]] = None
 
         self.icon_library: List[MiconIcon] = []
         self.icon_load_error: Optional[str] = None
-        self.icon_photo_cache: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
+        # Icon index -> template names using it, pinned to the template
+        # library it was built from; the library is replaced wholesale on
+        # reload, so an identity mismatch means the index is stale.
+        self._icon_users_cache: Optional[
+            Tuple[Dict[str, List[TemplateRecord]], Dict[int, List[str]]]
+        ] = None
+        # LRU-bounded: PhotoImages are big (104x104 plus Tcl overhead) and the
+        # working set is only the few dozen icons currently on screen.
+        self.icon_photo_cache: "OrderedDict[Tuple[int, int], ImageTk.PhotoImage]" = OrderedDict()
+        # Side-independent renders: (base RGBA, background mask, scale) per
+        # icon, so switching sides recolours instead of re-rendering.
+        self._icon_base_cache: Dict[int, Tuple[Image.Image, Optional[Image.Image], int]] = {}
+        # Source file behind the current icon caches; reloading the same
+        # unmodified MICONRES.RES keeps the rendered photos warm.
+        self._icon_cache_signature: Optional[Tuple[str, int]] = None
+        # GXL previews keyed by content digest and shared across the archive
+        # tabs, so duplicate images and tab revisits skip the PCX decode and
+        # Tk photo upload. LRU-bounded: full-screen PCX photos are large.
+        self.gxl_photo_cache: "OrderedDict[bytes, Tuple[ImageTk.PhotoImage, int, int, str]]" = OrderedDict()
         self.selected_icon_index: Optional[int] = None
         self.icon_preview_photo: Optional[ImageTk.PhotoImage] = None
+        # after_idle handle for a queued preview render; only one render is
+        # ever pending, so drag-scrolling the listbox coalesces into a single
+        # paint of the final selection.
+        self._pending_preview: Optional[str] = None
+        # (icon index, side) currently shown in each preview label; matching
+        # keys skip the Tk -image reconfigure on redundant refreshes.
+        self._last_preview_key: Optional[Tuple[int, int]] = None
+        self._last_unit_preview_key: Optional[Tuple[int, int]] = None
         self.icon_side_var = tk.IntVar(value=0)
 
         self.unit_icon_photo: Optional[ImageTk.PhotoImage] = None
@@ -182,18 +288,29 @@ class ScenarioEditorApp:
             value="Panel coordinates reference the STRATMAP insets (0=east, 1=west)."
         )
 
-        self._load_micon_library()
+        # Parse the icon and template files off the Tk thread so their I/O
+        # overlaps widget construction; _poll_background_loads folds the
+        # results in on the main loop once both futures resolve.
+        self._icon_future = self._image_executor.submit(self._read_micon_library)
+        self._template_future = self._image_executor.submit(load_template_library, self.game_dir)
         self._load_map_images()
-        try:
-            self.template_library = load_template_library(self.game_dir)
-        except Exception:  # pragma: no cover - defensive
-            self.template_library = {"air": [], "surface": [], "sub": []}
 
         self.selected_scenario_index: Optional[int] = None
         self.selected_region_index: Optional[int] = None
         self.selected_unit_kind: str = "air"
         self.selected_unit_slot: Optional[int] = None
 
+        # Pending ``after`` id for a coalesced unit-table refresh.
+        self._unit_refresh_pending: Optional[str] = None
+
+        # slot -> unit record per kind, rebuilt by refresh_unit_table so
+        # selection handlers resolve slots without scanning the table.
+        self._unit_by_slot: Dict[str, Dict[int, UnitRecord]] = {}
+
+        # (map id, formatted names) for the unit-region combobox, so each
+        # unit-table refresh skips rebuilding an unchanged list.
+        self._region_combo_values: Optional[Tuple[int, Tuple[str, ...]]] = None
+
         # Scenario selector variable (shared across tabs)
         self.scenario_selector_var = tk.StringVar()
 
@@ -201,6 +318,7 @@ class ScenarioEditorApp:
 
         self._build_menu()
         self._build_notebook()
+        self.root.after(50, self._poll_background_loads)
 
         default_scenario = self.game_dir / "SCENARIO.DAT"
         if default_scenario.exists():
@@ -232,41 +350,96 @@ class ScenarioEditorApp:
         self._build_map_tab()
         self._build_oob_tab()
         self._build_win_tab()
-        self._build_counters_tab()
-        self._build_gxl_tab("FLAGS.GXL", "Flags")
-        self._build_gxl_tab("GRAFIX.GXL", "Graphics")
-        self._build_gxl_tab("TRM.GXL", "Tactical Reference")
 
-    def _load_micon_library(self) -> None:
-        """Load the counter icons from MICONRES.RES if present."""
-        self.icon_photo_cache.clear()
-        self.icon_preview_photo = None
+        # The counters and GXL tabs decode icons/PCX archives up front, so
+        # their contents are built on first visit rather than at startup.
+        self._pending_tab_builders: Dict[str, Tuple[ttk.Frame, Callable[[ttk.Frame], None]]] = {}
+        self._add_lazy_tab("Map Icons (MICONRES.RES)", self._build_counters_tab)
+        for filename, tab_name in (
+            ("FLAGS.GXL", "Flags"),
+            ("GRAFIX.GXL", "Graphics"),
+            ("TRM.GXL", "Tactical Reference"),
+        ):
+            self._add_lazy_tab(
+                f"{tab_name} ({filename})",
+                lambda frame, filename=filename: self._build_gxl_tab(frame, filename),
+            )
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _add_lazy_tab(self, text: str, builder: Callable[[ttk.Frame], None]) -> None:
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        self._pending_tab_builders[str(frame)] = (frame, builder)
 
+    def _on_tab_changed(self, *_args) -> None:
+        pending = self._pending_tab_builders.pop(self.notebook.select(), None)
+        if pending is not None:
+            frame, builder = pending
+            builder(frame)
+
+    def _read_micon_library(self) -> Tuple[List[MiconIcon], Optional[str]]:
+        """Parse MICONRES.RES and return (icons, error).
+
+        Pure file work so it may run on a worker thread; callers apply the
+        result to the widgets on the Tk main loop.
+        """
         res_path = self.game_dir / "MICONRES.RES"
         if not res_path.exists():
-            self.icon_load_error = f"{res_path.name} not found."
-            self.icon_library = []
-            self._update_icon_status()
-            return
+            return [], f"{res_path.name} not found."
         try:
-            self.icon_library = load_micon_icons(res_path)
+            return load_micon_icons(res_path), None
         except Exception as exc:  # pragma: no cover - defensive
-            self.icon_library = []
-            self.icon_load_error = f"Failed to load {res_path.name}: {exc}"
-        else:
-            self.icon_load_error = None
+            return [], f"Failed to load {res_path.name}: {exc}"
+
+    def _micon_signature(self) -> Optional[Tuple[str, int]]:
+        """Identity of the icon source file: (path, mtime). None if absent."""
+        res_path = self.game_dir / "MICONRES.RES"
+        try:
+            return str(res_path), res_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_micon_library(self) -> None:
+        """Load the counter icons from MICONRES.RES if present."""
+        # The rendered photos only depend on the file contents, so a reload
+        # of the same unmodified file keeps them instead of re-rendering.
+        signature = self._micon_signature()
+        if signature is None or signature != self._icon_cache_signature:
+            self.icon_photo_cache.clear()
+            self._icon_base_cache.clear()
+            self.icon_preview_photo = None
+            self._last_preview_key = None
+            self._last_unit_preview_key = None
+            self._icon_cache_signature = signature
+
+        self.icon_library, self.icon_load_error = self._read_micon_library()
         self._update_icon_status()
         self._populate_icon_list()
 
+    def _poll_background_loads(self) -> None:
+        """Fold the startup icon/template futures into the UI once ready."""
+        if not (self._icon_future.done() and self._template_future.done()):
+            self.root.after(50, self._poll_background_loads)
+            return
+        self.icon_library, self.icon_load_error = self._icon_future.result()
+        self._icon_cache_signature = self._micon_signature()
+        try:
+            self.template_library = self._template_future.result()
+        except Exception:  # pragma: no cover - defensive
+            self.template_library = {"air": [], "surface": [], "sub": []}
+        self._icon_future = None
+        self._template_future = None
+        self._template_names_cache.clear()
+        self._update_icon_status()
+        self._populate_icon_list()
+        self.refresh_unit_table()
+
     def _load_map_images(self) -> None:
         """Load strategic and tactical maps for region graphics display.
 
         STRATMAP.PCX contains the in-game UI with map panels.
         The region coordinates are documented to map directly to these panels.
         """
-        from PIL import Image
-        import io
-
         # Load STRATMAP.PCX and TACTICAL.PCX from MAINLIB.GXL
         mainlib_path = self.game_dir / "MAINLIB.GXL"
         if mainlib_path.exists():
@@ -511,7 +684,7 @@ class ScenarioEditorApp:
             values=("air", "surface", "sub"),
         ).pack(side=tk.LEFT, padx=4)
         ttk.Label(selector, textvariable=self.oob_map_filename_var).pack(side=tk.LEFT, padx=4)
-        self.oob_kind_var.trace_add("write", lambda *_: self.refresh_unit_table())
+        self.oob_kind_var.trace_add("write", self._schedule_unit_refresh)
 
         self.oob_status_var = tk.StringVar(value="Load a map to view unit tables.")
         ttk.Label(frame, textvariable=self.oob_status_var).grid(
@@ -713,10 +886,7 @@ class ScenarioEditorApp:
             row=0, column=8, sticky="w", padx=2
         )
 
-    def _build_counters_tab(self) -> None:
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Map Icons (MICONRES.RES)")
-
+    def _build_counters_tab(self, frame: ttk.Frame) -> None:
         frame.columnconfigure(0, weight=0, minsize=200)  # List column with minimum size
         frame.columnconfigure(1, weight=1)
         frame.rowconfigure(2, weight=1)
@@ -784,11 +954,13 @@ class ScenarioEditorApp:
     def load_scenario_file(self, path: Path) -> None:
         if path.parent != self.game_dir:
             self.game_dir = path.parent
+            self._game_dir_index = None
             self._load_micon_library()
             try:
                 self.template_library = load_template_library(self.game_dir)
             except Exception:  # pragma: no cover
                 self.template_library = {"air": [], "surface": [], "sub": []}
+            self._template_names_cache.clear()
         try:
             self.scenario_file = ScenarioFile.load(path)
         except Exception as exc:
@@ -797,6 +969,17 @@ class ScenarioEditorApp:
         self.root.title(f"5th Fleet Scenario Editor — {path}")
         self.map_file = None
         self.map_file_path = None
+        self._scenario_dirty = False
+        self._map_dirty = False
+        self._resolved_map_path = None
+        self._objective_ports_cache.clear()
+        self._convoy_ship_names_cache.clear()
+        self._section9_strings_cache.clear()
+        self._pointer_entries_by_index = {}
+        self._parsed_script_cache.clear()
+        self._win_rows_cache.clear()
+        self._decoded_render_key = None
+        self._script_offset_cache.clear()
         self.oob_map_filename_var.set("")
         self.refresh_region_list()
         self.refresh_unit_table()
@@ -806,23 +989,66 @@ class ScenarioEditorApp:
             self._on_select_scenario()
         self.refresh_win_table()
 
+    @staticmethod
+    def _scenario_title(record: ScenarioRecord) -> str:
+        """Display title for a record, cached across list refreshes.
+
+        metadata_strings() re-walks the metadata entries on every call, so
+        the result is stashed on the record and dropped when the title is
+        edited.
+        """
+        title = getattr(record, "_display_title", None)
+        if title is None:
+            title = record.metadata_strings()[0] if record.metadata_entries else f"Scenario {record.index}"
+            record._display_title = title
+        return title
+
+    @staticmethod
+    def _fast_listbox_replace(listbox: tk.Listbox, items) -> None:
+        """Clear and repopulate a listbox through the raw Tcl interface.
+
+        One delete and one insert command cross into Tcl regardless of item
+        count, skipping the Listbox wrapper's per-call option handling.
+        """
+        listbox.tk.call(listbox._w, "delete", 0, "end")
+        if items:
+            listbox.tk.call((listbox._w, "insert", "end") + tuple(items))
+
+    def _scenario_list_label(self, record: ScenarioRecord) -> str:
+        title = self._scenario_title(record)
+        if record.raw_block is not None:
+            title = f"{title} [raw]"
+        return f"[{record.index}] {title} ({record.scenario_key or '?'})"
+
     def refresh_scenario_list(self) -> None:
-        self.scenario_listbox.delete(0, tk.END)
-        count = 0
         if not self.scenario_file:
+            self._fast_listbox_replace(self.scenario_listbox, ())
             self.scenario_count_var.set("Scenarios: 0")
             self._update_scenario_selector()
             return
-        for record in self.scenario_file.records:
-            count += 1
-            title = record.metadata_strings()[0] if record.metadata_entries else f"Scenario {record.index}"
-            key_hint = record.scenario_key or "?"
-            if record.raw_block is not None:
-                title = f"{title} [raw]"
-            self.scenario_listbox.insert(tk.END, f"[{record.index}] {title} ({key_hint})")
-        self.scenario_count_var.set(f"Scenarios: {count}")
+        items = [self._scenario_list_label(record) for record in self.scenario_file.records]
+        self._fast_listbox_replace(self.scenario_listbox, items)
+        self.scenario_count_var.set(f"Scenarios: {len(items)}")
         self._update_scenario_selector()
 
+    @staticmethod
+    def _set_var(var: tk.Variable, value) -> None:
+        """Write a Tk variable only when its value changes.
+
+        Selection handlers fire a burst of variable writes per click; each
+        write triggers Tcl traces and widget redraws even when the value is
+        identical, so no-op writes are skipped.
+        """
+        if var.get() != value:
+            var.set(value)
+
+    @staticmethod
+    def _set_text(widget: tk.Text, content: str) -> None:
+        """Replace a Text widget's content only when it actually differs."""
+        if widget.get("1.0", "end-1c") != content:
+            widget.delete("1.0", tk.END)
+            widget.insert(tk.END, content)
+
     def _on_select_scenario(self, *_args) -> None:
         if not self.scenario_file:
             return
@@ -836,15 +1062,15 @@ class ScenarioEditorApp:
         # Update the scenario selector combobox
         self._update_scenario_selector_value(index)
 
-        self.scenario_title_var.set(record.metadata_entries[0].text if record.metadata_entries else "")
-        self.forces_text.delete("1.0", tk.END)
-        self.forces_text.insert(tk.END, record.forces)
-        self.objectives_text.delete("1.0", tk.END)
-        self.objectives_text.insert(tk.END, record.objectives)
-        self.notes_text.delete("1.0", tk.END)
-        self.notes_text.insert(tk.END, record.notes)
-        self.scenario_key_var.set(record.scenario_key or "<unknown>")
-        self.scenario_difficulty_var.set(record.difficulty_token or "<unknown>")
+        self._set_var(self.scenario_title_var, record.metadata_entries[0].text if record.metadata_entries else "")
+        self._set_text(self.forces_text, record.forces)
+        self._set_text(self.objectives_text, record.objectives)
+        self._set_text(self.notes_text, record.notes)
+        # Arm Tk's modification tracking so Apply can tell edited from clean.
+        for widget in (self.forces_text, self.objectives_text, self.notes_text):
+            widget.edit_modified(False)
+        self._set_var(self.scenario_key_var, record.scenario_key or "<unknown>")
+        self._set_var(self.scenario_difficulty_var, record.difficulty_token or "<unknown>")
         self._ensure_map_for_scenario(record)
         self.refresh_win_table()
 
@@ -853,7 +1079,7 @@ class ScenarioEditorApp:
         scenarios = []
         if self.scenario_file:
             for record in self.scenario_file.records:
-                title = record.metadata_strings()[0] if record.metadata_entries else f"Scenario {record.index}"
+                title = self._scenario_title(record)
                 key_hint = record.scenario_key or "?"
                 scenarios.append(f"[{record.index}] {title} ({key_hint})")
 
@@ -927,9 +1153,20 @@ class ScenarioEditorApp:
             )
             return
 
-        record.forces = self.forces_text.get("1.0", tk.END).rstrip("\n")
-        record.objectives = self.objectives_text.get("1.0", tk.END).rstrip("\n")
-        record.notes = self.notes_text.get("1.0", tk.END).rstrip("\n")
+        # Nothing to do when no Text widget was touched and the title is
+        # unchanged; this skips the buffer copies that get() performs.
+        current_title = record.metadata_entries[0].text if record.metadata_entries else ""
+        texts_clean = not any(
+            widget.edit_modified()
+            for widget in (self.forces_text, self.objectives_text, self.notes_text)
+        )
+        if texts_clean and self.scenario_title_var.get().strip() == current_title:
+            return
+
+        # "end-1c" excludes the implicit trailing newline, so no rstrip pass.
+        record.forces = self.forces_text.get("1.0", "end-1c")
+        record.objectives = self.objectives_text.get("1.0", "end-1c")
+        record.notes = self.notes_text.get("1.0", "end-1c")
 
         # Update title (first metadata entry)
         title = self.scenario_title_var.get().strip()
@@ -937,21 +1174,41 @@ class ScenarioEditorApp:
             title = "Untitled Scenario"
 
         # Keep existing metadata entries but update the first one (title)
+        old_title = record.metadata_entries[0].text if record.metadata_entries else None
         if record.metadata_entries:
             record.metadata_entries[0].text = title
         else:
             record.metadata_entries = [MetadataEntry(text=title)]
-
-        self.refresh_scenario_list()
-        self.refresh_win_table()
+        for widget in (self.forces_text, self.objectives_text, self.notes_text):
+            widget.edit_modified(False)
+        self._scenario_dirty = True
+
+        # Only the title is visible in the scenario list, so rewrite that one
+        # row when it changed rather than rebuilding the whole listbox. The
+        # win table decodes trailing_bytes, which this method never touches;
+        # the win-word editors refresh it themselves.
+        if title != old_title:
+            record._display_title = None
+            self._update_scenario_list_row(self.selected_scenario_index)
+            self._update_scenario_selector()
         messagebox.showinfo("Scenario Updated", "Scenario changes applied in memory.")
 
+    def _update_scenario_list_row(self, index: int) -> None:
+        """Rewrite a single scenario listbox row in place."""
+        record = self.scenario_file.records[index]
+        selected = self.scenario_listbox.selection_includes(index)
+        self.scenario_listbox.delete(index)
+        self.scenario_listbox.insert(index, self._scenario_list_label(record))
+        if selected:
+            self.scenario_listbox.selection_set(index)
+
     def add_scenario(self) -> None:
         if self.scenario_file is None:
             return
         new_index = len(self.scenario_file.records)
         record = create_blank_scenario(new_index)
         self.scenario_file.records.append(record)
+        self._scenario_dirty = True
         self.refresh_scenario_list()
         self.scenario_listbox.selection_clear(0, tk.END)
         self.scenario_listbox.selection_set(new_index)
@@ -968,14 +1225,14 @@ class ScenarioEditorApp:
             clone.forces = original.forces
             clone.objectives = original.objectives
             clone.notes = original.notes
-            clone.metadata_entries = [
-                MetadataEntry(text=entry.text, extra_zero_count=entry.extra_zero_count)
-                for entry in original.metadata_entries
-            ]
+            clone.metadata_entries = [entry.clone() for entry in original.metadata_entries]
             clone.metadata_leading_zeros = original.metadata_leading_zeros
-            clone.trailing_bytes = bytes(original.trailing_bytes)
+            # bytes is immutable and every editor replaces trailing_bytes
+            # wholesale, so the clone can share the original's object.
+            clone.trailing_bytes = original.trailing_bytes
             clone.has_special_notes_marker = original.has_special_notes_marker
         self.scenario_file.records.append(clone)
+        self._scenario_dirty = True
         self.refresh_scenario_list()
 
     def delete_scenario(self) -> None:
@@ -984,13 +1241,24 @@ class ScenarioEditorApp:
         if len(self.scenario_file.records) <= 1:
             messagebox.showwarning("Cannot Delete", "At least one scenario must remain.")
             return
-        del self.scenario_file.records[self.selected_scenario_index]
-        for idx, record in enumerate(self.scenario_file.records):
-            record.index = idx
-        self.refresh_scenario_list()
+        index = self.selected_scenario_index
+        del self.scenario_file.records[index]
+        self._scenario_dirty = True
+        records = self.scenario_file.records
+        # Only rows at or after the deletion point change (their index prefix
+        # shifts), so reindex and rewrite just that suffix of the listbox.
+        for idx in range(index, len(records)):
+            records[idx].index = idx
+        self.scenario_listbox.delete(index, tk.END)
+        if index < len(records):
+            self.scenario_listbox.insert(
+                tk.END, *[self._scenario_list_label(record) for record in records[index:]]
+            )
+        self.scenario_count_var.set(f"Scenarios: {len(records)}")
+        self._update_scenario_selector()
         self.selected_scenario_index = None
         self.scenario_listbox.selection_clear(0, tk.END)
-        self.win_tree.delete(*self.win_tree.get_children())
+        self._bulk_populate(self.win_tree, ())
 
     # ------------------------------------------------------------------#
     # Map handling
@@ -998,6 +1266,7 @@ class ScenarioEditorApp:
     def load_map_file(self, path: Path) -> None:
         if path.parent != self.game_dir:
             self.game_dir = path.parent
+            self._game_dir_index = None
             self._load_micon_library()
         try:
             self.map_file = MapFile.load(path)
@@ -1005,6 +1274,16 @@ class ScenarioEditorApp:
             messagebox.showerror("Error", f"Failed to load map file:\n{exc}")
             return
         self.map_file_path = path
+        self._resolved_map_path = path.resolve()
+        self._map_dirty = False
+        self._objective_ports_cache.clear()
+        self._convoy_ship_names_cache.clear()
+        self._section9_strings_cache.clear()
+        self._decoded_render_key = None
+        # First entry wins on duplicate indices, matching the old scans.
+        self._pointer_entries_by_index = {}
+        for entry in self.map_file.pointer_entries:
+            self._pointer_entries_by_index.setdefault(entry.index, entry)
         self.oob_map_filename_var.set(f"({path.name})")
 
         # Update tab labels to show filenames
@@ -1015,6 +1294,9 @@ class ScenarioEditorApp:
             self.template_library = load_template_library(path.parent)
         except Exception:  # pragma: no cover
             self.template_library = {"air": [], "surface": [], "sub": []}
+        # The library was just replaced, so the memoized name tuples built
+        # from the previous directory's templates are stale.
+        self._template_names_cache.clear()
         self.refresh_region_list()
         self.refresh_unit_table()
         self._populate_region_names_for_units()
@@ -1022,11 +1304,19 @@ class ScenarioEditorApp:
         self._clear_port_details("Select a port-related opcode to view details.")
 
     def refresh_region_list(self) -> None:
-        self.region_listbox.delete(0, tk.END)
+        # All region mutations funnel through here, so this doubles as the
+        # invalidation point for the name cache and the decoded rows that
+        # embed region names.
+        self._region_name_cache.clear()
+        self._win_rows_cache.clear()
+        self._region_combo_values = None
         if not self.map_file:
+            self._fast_listbox_replace(self.region_listbox, ())
             return
-        for region in self.map_file.regions:
-            self.region_listbox.insert(tk.END, f"[{region.index:02}] {region.name}")
+        self._fast_listbox_replace(
+            self.region_listbox,
+            [f"[{region.index:02}] {region.name}" for region in self.map_file.regions],
+        )
 
     def _on_select_region(self, *_args) -> None:
         if not self.map_file:
@@ -1038,15 +1328,26 @@ class ScenarioEditorApp:
         region = self.map_file.regions[index]
         self.selected_region_index = index
 
-        self.region_name_var.set(region.name)
-        code = region.region_code() or ""
-        self.region_code_var.set(code)
-        self.region_adj_var.set(", ".join(region.adjacent_codes()))
-        position = region.map_position() or {"panel": 0, "x_raw": 0, "y_raw": 0, "width_raw": 0}
-        self.region_panel_var.set(position["panel"])
-        self.region_x_var.set(position["x_raw"])
-        self.region_y_var.set(position["y_raw"])
-        self.region_width_var.set(position["width_raw"])
+        # Scrolling through the list re-derives identical code/adjacency/
+        # position values per region; cache them on the record and invalidate
+        # in apply_region_changes, the only mutation path.
+        cached = getattr(region, "_display_cache", None)
+        if cached is None:
+            cached = (
+                region.region_code() or "",
+                ", ".join(region.adjacent_codes()),
+                region.map_position() or {"panel": 0, "x_raw": 0, "y_raw": 0, "width_raw": 0},
+            )
+            region._display_cache = cached
+        code, adjacency_csv, position = cached
+
+        self._set_var(self.region_name_var, region.name)
+        self._set_var(self.region_code_var, code)
+        self._set_var(self.region_adj_var, adjacency_csv)
+        self._set_var(self.region_panel_var, position["panel"])
+        self._set_var(self.region_x_var, position["x_raw"])
+        self._set_var(self.region_y_var, position["y_raw"])
+        self._set_var(self.region_width_var, position["width_raw"])
         self._update_region_panel_summary(position)
 
         # Display region graphics
@@ -1080,8 +1381,6 @@ class ScenarioEditorApp:
 
     def _display_region_graphics(self, position: Dict) -> None:
         """Display the region using the same STRATMAP/TACTICAL inset data as the game."""
-        from PIL import Image, ImageDraw
-
         if not self.region_map_canvas:
             return
 
@@ -1209,6 +1508,8 @@ class ScenarioEditorApp:
         self.region_y_var.set(y_raw)
         self.region_width_var.set(width_raw)
         region.set_map_position(panel, x_raw, y_raw, width_raw)
+        region._display_cache = None
+        self._map_dirty = True
         new_position = region.map_position() or {"panel": panel, "x_raw": x_raw, "y_raw": y_raw, "width_raw": width_raw}
         self._update_region_panel_summary(new_position)
         self._display_region_graphics(new_position)
@@ -1227,6 +1528,7 @@ class ScenarioEditorApp:
         template.set_map_position(0, 0, 0, 0)
         template.index = len(self.map_file.regions)
         self.map_file.regions.append(template)
+        self._map_dirty = True
         self.refresh_region_list()
 
     def duplicate_region(self) -> None:
@@ -1237,6 +1539,7 @@ class ScenarioEditorApp:
         clone.index = len(self.map_file.regions)
         clone.name = f"{original.name} Copy"
         self.map_file.regions.append(clone)
+        self._map_dirty = True
         self.refresh_region_list()
 
     def delete_region(self) -> None:
@@ -1245,10 +1548,22 @@ class ScenarioEditorApp:
         if len(self.map_file.regions) <= 1:
             messagebox.showwarning("Cannot Delete", "At least one region must remain.")
             return
-        del self.map_file.regions[self.selected_region_index]
-        for idx, region in enumerate(self.map_file.regions):
-            region.index = idx
-        self.refresh_region_list()
+        index = self.selected_region_index
+        del self.map_file.regions[index]
+        self._map_dirty = True
+        regions = self.map_file.regions
+        for idx in range(index, len(regions)):
+            regions[idx].index = idx
+        # Region indices shifted, so the derived caches are stale even though
+        # the earlier rows' labels are not.
+        self._region_name_cache.clear()
+        self._win_rows_cache.clear()
+        self._region_combo_values = None
+        self.region_listbox.delete(index, tk.END)
+        if index < len(regions):
+            self.region_listbox.insert(
+                tk.END, *[f"[{region.index:02}] {region.name}" for region in regions[index:]]
+            )
         self.selected_region_index = None
         self.region_listbox.selection_clear(0, tk.END)
         self._populate_region_names_for_units()
@@ -1257,12 +1572,39 @@ class ScenarioEditorApp:
     # Order of battle handling
     # ------------------------------------------------------------------#
 
+    @staticmethod
+    def _bulk_populate(tree: ttk.Treeview, rows) -> None:
+        """Replace a tree's rows ((iid, values, tags)) with layout suspended.
+
+        Hiding the display columns keeps Tk from re-laying out the view once
+        per removed/inserted row; the original layout is restored afterwards,
+        so the whole swap costs a single repaint.
+        """
+        display = tree["displaycolumns"]
+        tree["displaycolumns"] = ()
+        try:
+            tree.delete(*tree.get_children())
+            for iid, values, tags in rows:
+                tree.insert("", tk.END, iid=iid, values=values, tags=tags)
+        finally:
+            tree["displaycolumns"] = display
+
+    def _schedule_unit_refresh(self, *_args) -> None:
+        """Coalesce bursts of trace-driven refreshes into a single rebuild."""
+        if self._unit_refresh_pending is not None:
+            self.root.after_cancel(self._unit_refresh_pending)
+        self._unit_refresh_pending = self.root.after(50, self._do_unit_refresh)
+
+    def _do_unit_refresh(self) -> None:
+        self._unit_refresh_pending = None
+        self.refresh_unit_table()
+
     def refresh_unit_table(self) -> None:
 
-        self.unit_tree.delete(*self.unit_tree.get_children())
         self._populate_region_names_for_units()
         unit_table = self._current_unit_table()
         if unit_table is None:
+            self._bulk_populate(self.unit_tree, ())
             if self.map_file is None:
                 self.oob_status_var.set("Load a map to view unit tables.")
             else:
@@ -1271,58 +1613,85 @@ class ScenarioEditorApp:
             return
 
         if not unit_table.units:
+            self._bulk_populate(self.unit_tree, ())
+            self._unit_by_slot[unit_table.kind] = {}
             self.oob_status_var.set(f"No units found in {unit_table.kind} table.")
             self._clear_unit_icon_preview()
             return
 
         self.oob_status_var.set("")
         template_records = self._template_records(unit_table.kind)
-        added_units = []  # Track which units were actually added to the tree
-
-        for unit in unit_table.units:
-            added_units.append(unit)
-            
-            if template_records and 0 <= unit.template_id < len(template_records):
-                template = template_records[unit.template_id]
-                name_display = template.name
-                # Get the effective icon index (including default for submarines)
-                effective_icon = self._template_icon_index(unit_table.kind, unit.template_id)
-                if effective_icon is not None:
-                    name_display = f"{template.name} (#{effective_icon})"
-                vp_value = template.victory_points if template.victory_points is not None else "n/a"
-                self.unit_vp_var.set(f"VP: {vp_value}")
+
+        # Per-template formatting only depends on template_id, so build the
+        # display-name/VP arrays once per refresh instead of re-deriving them
+        # for every unit row.
+        display_names: List[str] = []
+        vp_labels: List[str] = []
+        for template_id, template in enumerate(template_records):
+            name_display = template.name
+            # Get the effective icon index (including default for submarines)
+            effective_icon = self._template_icon_index(unit_table.kind, template_id)
+            if effective_icon is not None:
+                name_display = f"{template.name} (#{effective_icon})"
+            display_names.append(name_display)
+            vp_value = template.victory_points if template.victory_points is not None else "n/a"
+            vp_labels.append(f"VP: {vp_value}")
+
+        # Pull the unit fields into parallel lists and zip them back together
+        # for the row loop; the field extraction walks each record once rather
+        # than chasing attributes repeatedly mid-formatting.
+        units = unit_table.units
+        self._unit_by_slot[unit_table.kind] = {unit.slot: unit for unit in units}
+        slots = [unit.slot for unit in units]
+        template_ids = [unit.template_id for unit in units]
+        sides = [unit.owner_raw & 0x03 for unit in units]
+        summaries = [self._unit_position_summary(unit) for unit in units]
+
+        rows = []
+        for slot, template_id, side, summary in zip(slots, template_ids, sides, summaries):
+            if 0 <= template_id < len(display_names):
+                name_display = display_names[template_id]
+                self.unit_vp_var.set(vp_labels[template_id])
             else:
-                template = None
-                max_id = len(template_records) - 1 if template_records else 0
-                name_display = f"Template {unit.template_id} (out of range 0-{max_id})"
+                max_id = len(display_names) - 1 if display_names else 0
+                name_display = f"Template {template_id} (out of range 0-{max_id})"
                 self.unit_vp_var.set("VP: n/a")
-            position_summary = self._unit_position_summary(unit)
-            self.unit_tree.insert(
-                "",
-                tk.END,
-                iid=str(unit.slot),
-                values=(
-                    unit.slot,
-                    name_display,
-                    unit.owner_raw & 0x03,
-                    position_summary["region"],
-                    position_summary["tile"],
-                ),
+            rows.append(
+                (
+                    str(slot),
+                    (slot, name_display, side, summary["region"], summary["tile"]),
+                    (),
+                )
             )
+        self._bulk_populate(self.unit_tree, rows)
         self._refresh_unit_template_combo()
-        current_selection = self.unit_tree.selection()
-        if current_selection:
-            self._on_select_unit()
-        elif added_units:  # Changed: select first ADDED unit, not first unit in table
-            self.unit_tree.selection_set(str(added_units[0].slot))
-            self._on_select_unit()
+        # _bulk_populate rebuilt every row, which drops the Tk selection.
+        # Re-select the previously selected slot when it survived the refresh
+        # (first row otherwise) and fill the detail pane directly with the
+        # record we just indexed, instead of round-tripping through a
+        # selection() query plus another slot lookup in _on_select_unit.
+        unit = self._unit_by_slot[unit_table.kind].get(self.selected_unit_slot)
+        if unit is None:
+            unit = units[0]
+        self.unit_tree.selection_set(str(unit.slot))
+        self.selected_unit_slot = unit.slot
+        self._show_unit_details(unit_table, unit)
 
     def _populate_region_names_for_units(self) -> None:
         if self.map_file is None:
             self.unit_region_combo["values"] = []
             return
-        names = [f"{idx}: {region.name}" for idx, region in enumerate(self.map_file.regions)]
-        self.unit_region_combo["values"] = names
+        map_id = id(self.map_file)
+        cached = self._region_combo_values
+        if cached is not None and cached[0] == map_id:
+            names = cached[1]
+        else:
+            names = tuple(
+                f"{idx}: {region.name}" for idx, region in enumerate(self.map_file.regions)
+            )
+            self._region_combo_values = (map_id, names)
+        if tuple(self.unit_region_combo["values"]) != names:
+            self.unit_region_combo["values"] = names
         if names:
             self.unit_region_combo.current(0)
 
@@ -1332,7 +1701,8 @@ class ScenarioEditorApp:
             self.unit_template_combo["values"] = []
             return
         template_names = self._template_names(unit_table.kind)
-        self.unit_template_combo["values"] = template_names
+        if tuple(self.unit_template_combo["values"]) != template_names:
+            self.unit_template_combo["values"] = template_names
         if template_names:
             self.unit_template_combo.current(0)
 
@@ -1351,24 +1721,32 @@ class ScenarioEditorApp:
             return
         slot = int(selection[0])
         self.selected_unit_slot = slot
-        unit = next((u for u in unit_table.units if u.slot == slot), None)
+        unit = self._unit_by_slot.get(unit_table.kind, {}).get(slot)
         if unit is None:
             self._clear_unit_icon_preview()
             return
+        self._show_unit_details(unit_table, unit)
+
+    def _show_unit_details(self, unit_table, unit: UnitRecord) -> None:
+        """Fill the unit detail pane for *unit*.
+
+        Split out of _on_select_unit so refresh_unit_table can hand over the
+        record it already holds without re-reading the Treeview selection.
+        """
         names = self._template_names(unit_table.kind)
         template_name = names[unit.template_id] if 0 <= unit.template_id < len(names) else ""
-        self.unit_template_var.set(template_name)
-        self.unit_side_var.set(unit.owner_raw & 0x03)
+        self._set_var(self.unit_template_var, template_name)
+        self._set_var(self.unit_side_var, unit.owner_raw & 0x03)
         region_name = self._region_name(unit.region_index)
         if region_name:
-            self.unit_region_var.set(f"{unit.region_index}: {region_name}")
+            self._set_var(self.unit_region_var, f"{unit.region_index}: {region_name}")
         else:
-            self.unit_region_var.set(str(unit.region_index))
-        self.unit_x_var.set(unit.tile_x)
-        self.unit_y_var.set(unit.tile_y)
+            self._set_var(self.unit_region_var, str(unit.region_index))
+        self._set_var(self.unit_x_var, unit.tile_x)
+        self._set_var(self.unit_y_var, unit.tile_y)
         summary = self._unit_position_summary(unit)
         note_text = summary["note"] if summary["note"] else "Position data unavailable"
-        self.unit_position_info_var.set(f"Position: {note_text}")
+        self._set_var(self.unit_position_info_var, f"Position: {note_text}")
         self._update_unit_icon_preview(unit_table.kind, unit)
 
     def add_unit(self) -> None:
@@ -1391,13 +1769,14 @@ class ScenarioEditorApp:
         except ValueError as exc:
             messagebox.showerror("Cannot Add Unit", str(exc))
             return
+        self._map_dirty = True
         self.refresh_unit_table()
 
     def apply_unit(self) -> None:
         unit_table = self._current_unit_table()
         if unit_table is None or self.selected_unit_slot is None:
             return
-        unit = next((u for u in unit_table.units if u.slot == self.selected_unit_slot), None)
+        unit = self._unit_by_slot.get(unit_table.kind, {}).get(self.selected_unit_slot)
         if unit is None:
             return
         template_names = self._template_names(unit_table.kind)
@@ -1421,6 +1800,7 @@ class ScenarioEditorApp:
         unit.region_index = region_index
         unit.tile_x = self.unit_x_var.get()
         unit.tile_y = self.unit_y_var.get()
+        self._map_dirty = True
         self._update_unit_icon_preview(unit_table.kind, unit)
         self.refresh_unit_table()
 
@@ -1430,14 +1810,31 @@ class ScenarioEditorApp:
             return
         unit_table.remove_unit(self.selected_unit_slot)
         self.selected_unit_slot = None
+        self._map_dirty = True
         self.refresh_unit_table()
 
     def _region_name(self, index: int) -> str:
         if self.map_file is None:
             return ""
-        if 0 <= index < len(self.map_file.regions):
-            return self.map_file.regions[index].name
-        return ""
+        name = self._region_name_cache.get(index)
+        if name is None:
+            if 0 <= index < len(self.map_file.regions):
+                name = self.map_file.regions[index].name
+            else:
+                name = ""
+            self._region_name_cache[index] = name
+        return name
+
+    def _region_label(self, operand: int, regions_len: int) -> str:
+        """Region name for in-range operands, ``"region N"`` otherwise.
+
+        Shared by the END/victory-check branches of both renderers;
+        ``regions_len`` is the bound the caller hoisted out of its loop, and
+        _region_name itself is memoized so hits cost one dict lookup.
+        """
+        if operand < regions_len:
+            return self._region_name(operand)
+        return f"region {operand}"
 
     def _unit_position_summary(self, unit: UnitRecord) -> Dict[str, str]:
         summary = {
@@ -1523,15 +1920,40 @@ class ScenarioEditorApp:
 
         return None
 
+    def _get_section9_strings(self) -> List[str]:
+        """Return the null-terminated strings from pointer section 9, cached.
+
+        The opcode decoders index this table once per rendered script word,
+        so it is parsed once per loaded map with a single C-level split
+        instead of a byte-at-a-time Python scan on every call. All strings
+        are kept (including single-char fragments) so operand indexing lines
+        up with the game's own table.
+        """
+        map_id = id(self.map_file)
+        cached = self._section9_strings_cache.get(map_id)
+        if cached is not None:
+            return cached
+
+        strings: List[str] = []
+        entry = self._pointer_entries_by_index.get(9)
+        if entry is not None:
+            section_data = bytes(
+                self.map_file.pointer_blob[entry.start:entry.start + entry.count]
+            )
+            strings = [
+                chunk.decode("latin1", errors="replace")
+                for chunk in section_data.split(b"\x00")
+                if chunk
+            ]
+        self._section9_strings_cache[map_id] = strings
+        return strings
+
     def _extract_base_name(self, base_rule_operand: int) -> Optional[str]:
         """Extract base/airfield name from pointer section 9 using BASE_RULE operand.
 
         BASE_RULE mapping:
         - operand 0: Special case (no specific base)
         - operand >= 1: pointer_section_9[operand - 1] → base name
-
-        Pointer section 9 contains null-terminated strings. We parse ALL strings
-        (including single-char fragments) and index using (operand - 1).
         """
         if self.map_file is None:
             return None
@@ -1541,37 +1963,7 @@ class ScenarioEditorApp:
         if base_rule_operand == 0:
             return None  # Return None so caller displays generic message
 
-        # Find pointer section 9
-        pointer_section_9 = None
-        for entry in self.map_file.pointer_entries:
-            if entry.index == 9:
-                pointer_section_9 = entry
-                break
-
-        if pointer_section_9 is None:
-            return None
-
-        # Extract the raw data for pointer section 9
-        start_offset = pointer_section_9.start
-        # Calculate actual size by finding end of section
-        # The pointer_blob starts at pointer_data_base
-        section_data = self.map_file.pointer_blob[start_offset:start_offset + pointer_section_9.count]
-
-        # Parse ALL null-terminated strings (including fragments)
-        strings = []
-        i = 0
-        while i < len(section_data):
-            if section_data[i] == 0:
-                i += 1
-                continue
-
-            start = i
-            while i < len(section_data) and section_data[i] != 0:
-                i += 1
-
-            string = section_data[start:i].decode('latin1', errors='replace')
-            strings.append(string)
-            i += 1
+        strings = self._get_section9_strings()
 
         # Apply the mapping formula: string_index = operand - 1
         string_index = base_rule_operand - 1
@@ -1600,31 +1992,7 @@ class ScenarioEditorApp:
         if self.map_file is None:
             return None
 
-        # Find pointer section 9
-        pointer_section_9 = None
-        for entry in self.map_file.pointer_entries:
-            if entry.index == 9:
-                pointer_section_9 = entry
-                break
-
-        if pointer_section_9 is None:
-            return None
-
-        section_data = self.map_file.pointer_blob[pointer_section_9.start:pointer_section_9.start + pointer_section_9.count]
-
-        # Extract all strings
-        strings = []
-        i = 0
-        while i < len(section_data):
-            if section_data[i] == 0:
-                i += 1
-                continue
-            start = i
-            while i < len(section_data) and section_data[i] != 0:
-                i += 1
-            string = section_data[start:i].decode('latin1', errors='replace')
-            strings.append(string)
-            i += 1
+        strings = self._get_section9_strings()
 
         # Try multiple formulas
         for formula_offset in [-2, -1, 0]:
@@ -1638,7 +2006,20 @@ class ScenarioEditorApp:
         return None
 
     def _extract_objective_ports(self) -> List[str]:
-        """Return objective port names using parsed data when available.
+        """Return objective port names for the current map, cached per map.
+
+        The underlying scan re-reads the map file, so the result is memoized
+        on the loaded MapFile identity and invalidated on map/scenario load.
+        """
+        map_id = id(self.map_file)
+        cached = self._objective_ports_cache.get(map_id)
+        if cached is None:
+            cached = self._scan_objective_ports()
+            self._objective_ports_cache[map_id] = cached
+        return cached
+
+    def _scan_objective_ports(self) -> List[str]:
+        """Scan for objective port names using parsed data when available.
 
         Falls back to a raw pattern search if necessary.
         """
@@ -1817,24 +2198,15 @@ class ScenarioEditorApp:
         # Get all known base names from pointer section 9
         known_bases = set()
         if self.map_file:
-            for entry in self.map_file.pointer_entries:
-                if entry.index == 9:
-                    data = entry.data
-                    i = 0
-                    while i < len(data):
-                        if data[i] == 0:
-                            i += 1
-                            continue
-                        start = i
-                        while i < len(data) and data[i] != 0:
-                            i += 1
-                        try:
-                            string = data[start:i].decode('latin1', errors='replace')
-                            if len(string) >= 4 and string[0].isupper() and string.replace(' ', '').isalpha():
-                                known_bases.add(string)
-                        except:
-                            pass
-                        i += 1
+            entry = self._pointer_entries_by_index.get(9)
+            if entry is not None:
+                # One C-level split instead of a byte-at-a-time Python scan.
+                for chunk in entry.data.split(b"\x00"):
+                    if not chunk:
+                        continue
+                    string = chunk.decode('latin1', errors='replace')
+                    if len(string) >= 4 and string[0].isupper() and string.replace(' ', '').isalpha():
+                        known_bases.add(string)
 
         # Search for each known base in the objectives text
         for base in known_bases:
@@ -1846,6 +2218,20 @@ class ScenarioEditorApp:
         return bases
 
     def _extract_convoy_ship_names(self) -> List[str]:
+        """Return convoy ship names for the current map, cached per map.
+
+        Both the SPECIAL_RULE 0x06 and CONVOY_PORT branches ask for the list,
+        so the section-14 scan is memoized on the loaded MapFile identity and
+        invalidated on map/scenario load.
+        """
+        map_id = id(self.map_file)
+        cached = self._convoy_ship_names_cache.get(map_id)
+        if cached is None:
+            cached = self._scan_convoy_ship_names()
+            self._convoy_ship_names_cache[map_id] = cached
+        return cached
+
+    def _scan_convoy_ship_names(self) -> List[str]:
         """Extract convoy ship names from MAP pointer section 14.
 
         Searches for ships with "Fast Convoy" classification and extracts their names.
@@ -1855,47 +2241,51 @@ class ScenarioEditorApp:
             return []
 
         # Find pointer section 14 (unit names/classifications)
-        pointer_section_14 = None
-        for entry in self.map_file.pointer_entries:
-            if entry.index == 14:
-                pointer_section_14 = entry
-                break
-
+        pointer_section_14 = self._pointer_entries_by_index.get(14)
         if pointer_section_14 is None:
             return []
 
         data = pointer_section_14.data
-        convoy_ships = []
+        convoy_ships = set()
 
         # Search for pattern: "ShipName\x00...\x00Fast Convoy\x00"
-        # The ship name appears shortly before "Fast Convoy" classification
-        i = 0
-        while i < len(data) - 20:
-            # Look for start of alphabetic string
-            if data[i] >= 0x41 and data[i] <= 0x7A:  # A-Z, a-z
-                start = i
-                while i < len(data) and data[i] != 0:
-                    i += 1
-                if i > start:
-                    potential_name = data[start:i].decode('latin1', errors='replace')
-                    # Look ahead for "Fast Convoy" within next 20 bytes
-                    search_end = min(len(data), i + 20)
-                    if b'Fast Convoy' in data[i:search_end]:
-                        # Filter out garbage strings (must be reasonable ship name)
-                        if len(potential_name) >= 3 and potential_name[0].isupper():
-                            convoy_ships.append(potential_name)
-            i += 1
+        # The ship name appears shortly before "Fast Convoy" classification.
+        # Jump between classification matches with C-level find() and only
+        # inspect the few bytes around each one, rather than scanning the
+        # whole section byte-by-byte in Python.
+        search = 0
+        while True:
+            match = data.find(b"Fast Convoy", search)
+            if match == -1:
+                break
+            search = match + 1
+            # The name's terminating NUL must sit close enough that the
+            # classification falls inside the 20-byte look-ahead window.
+            for end in range(max(match - 9, 1), match + 1):
+                if data[end] != 0:
+                    continue
+                chunk = data[data.rfind(b"\x00", 0, end) + 1:end]
+                # The name starts at the run's first alphabetic byte.
+                offset = next(
+                    (k for k, byte in enumerate(chunk) if 0x41 <= byte <= 0x7A), None
+                )
+                if offset is None:
+                    continue
+                name = chunk[offset:].decode('latin1', errors='replace')
+                # Filter out garbage strings (must be reasonable ship name)
+                if len(name) >= 3 and name[0].isupper():
+                    convoy_ships.add(name)
 
         # Return unique names only (each ship appears twice in section 14)
-        return sorted(set(convoy_ships))
+        return sorted(convoy_ships)
 
     # ------------------------------------------------------------------#
     # Win conditions handling
     # ------------------------------------------------------------------#
     def refresh_win_table(self) -> None:
-        self.win_tree.delete(*self.win_tree.get_children())
         record = self._current_record()
         if record is None:
+            self._bulk_populate(self.win_tree, ())
             if hasattr(self, "decoded_objectives_text"):
                 self.decoded_objectives_text.config(state=tk.NORMAL)
                 self.decoded_objectives_text.delete("1.0", tk.END)
@@ -1909,19 +2299,43 @@ class ScenarioEditorApp:
         if hasattr(self, "decoded_objectives_text"):
             self._render_decoded_objectives(script, record)
 
-        # Pre-scan to find END opcode as potential section separator
-        # This can be END(0), END(1), or any END with opcodes after it
+        # Rows are pure functions of the script bytes and the loaded map
+        # (descriptions resolve names against it), so reuse them until either
+        # changes; apply/remove replace trailing_bytes wholesale, which makes
+        # the identity check a reliable invalidation signal.
+        key = id(record.trailing_bytes)
+        cached = self._win_rows_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] is record.trailing_bytes
+            and cached[1] == id(self.map_file)
+        ):
+            rows = cached[2]
+        else:
+            rows = self._build_win_rows(script)
+            if len(self._win_rows_cache) > 256:
+                self._win_rows_cache.clear()
+            self._win_rows_cache[key] = (record.trailing_bytes, id(self.map_file), rows)
+        self._bulk_populate(self.win_tree, rows)
+        self.win_index_var.set("-")
+
+    _PLAYER_ROW_TAGS = {
+        "Green": ("green_row",),
+        "Red": ("red_row",),
+        "Campaign": ("campaign_row",),
+        "Neutral": ("neutral_row",),
+    }
+
+    def _build_win_rows(self, script: List[Tuple[int, int]]) -> List[tuple]:
+        """Decode script words into win-table row tuples for _bulk_populate."""
+        # One prescan pass supplies the section markers and the END-separator
+        # index (END(0), END(1), or any END with more opcodes after it).
         # Example: Scenario 5 has TURNS(0x0d), objectives, END(0), more objectives
-        end_zero_index = None
-        has_explicit_red_marker = any(op == 0x01 and oper == 0x00 for op, oper in script)
-        has_explicit_green_marker = any(op == 0x01 and oper == 0x0d for op, oper in script)
-        has_campaign_marker = any(op == 0x01 and oper == 0xc0 for op, oper in script)
-        for idx, (op, oper) in enumerate(script):
-            if op == 0x00:
-                # Check if there are more opcodes after this END
-                if idx + 1 < len(script):
-                    end_zero_index = idx
-                break
+        script_flags = self._prescan_script(script)
+        has_explicit_red_marker = script_flags["has_red_marker"]
+        has_explicit_green_marker = script_flags["has_green_marker"]
+        has_campaign_marker = script_flags["has_campaign_marker"]
+        end_zero_index = script_flags["end_zero_index"]
 
         # Populate tree with opcode details
         current_player = None  # Track which player context we're in
@@ -1941,17 +2355,28 @@ class ScenarioEditorApp:
             # Display with neutral coloring since there's no player split in the opcode script
             current_player = "Neutral"
 
+        rows = []
+        # Bind the per-word lookups once; the loop body otherwise pays a
+        # LOAD_GLOBAL/LOAD_ATTR chain for each of them on every script word.
+        # Region names are flattened to a tuple so the decode branches index
+        # it directly instead of re-walking map_file attributes per word.
+        opcode_rows = _OPCODE_ROWS
+        format_operand = self._format_operand
+        decode_description = self._decode_opcode_description
+        # Long runs of rows share one player context; mapping it straight to
+        # a shared tag tuple drops the per-row elif chain and reuses the same
+        # tuple object for every row in the run.
+        player_row_tags = self._PLAYER_ROW_TAGS
+        region_names = (
+            tuple(region.name for region in self.map_file.regions) if self.map_file else ()
+        )
         for idx, (opcode, operand) in enumerate(script):
-            if opcode in OPCODE_MAP:
-                mnemonic, op_type, _ = OPCODE_MAP[opcode]
-            else:
-                mnemonic = f"UNKNOWN_{opcode:02x}"
-                op_type = "?"
+            hex_label, mnemonic, op_type = opcode_rows[opcode]
 
-            operand_display = self._format_operand(operand)
+            operand_display = format_operand(operand)
 
             # Decode the actual description based on opcode and operand value
-            description = self._decode_opcode_description(opcode, operand)
+            description = decode_description(opcode, operand, region_names)
 
             # Determine row color based on PLAYER_SECTION opcode and current player context
             tags = ()
@@ -1973,164 +2398,209 @@ class ScenarioEditorApp:
                     # Don't apply tags to the delimiter itself
             else:
                 # Apply player-specific background to non-PLAYER_SECTION opcodes
-                if current_player == "Green":
-                    tags = ("green_row",)
-                elif current_player == "Red":
-                    tags = ("red_row",)
-                elif current_player == "Campaign":
-                    tags = ("campaign_row",)
-                elif current_player == "Neutral":
-                    tags = ("neutral_row",)
-
-            self.win_tree.insert(
-                "",
-                tk.END,
-                iid=str(idx),
-                values=(
-                    idx,
-                    f"0x{opcode:02x}",
-                    operand_display,
-                    f"{mnemonic}({operand})",
-                    description
-                ),
-                tags=tags,
+                tags = player_row_tags.get(current_player, ())
+
+            rows.append(
+                (
+                    str(idx),
+                    (
+                        idx,
+                        hex_label,
+                        operand_display,
+                        f"{mnemonic}({operand})",
+                        description,
+                    ),
+                    tags,
+                )
             )
-        self.win_index_var.set("-")
+        return rows
 
-    def _decode_opcode_description(self, opcode: int, operand: int) -> str:
+    # ------------------------------------------------------------------#
+    # Objective-opcode description handlers
+    #
+    # One small handler per opcode keyed by _DESC_HANDLERS, mirroring the
+    # renderer's _RENDER_HANDLERS table: a dict lookup replaces the long
+    # elif chain so dispatch cost no longer grows with the number of
+    # decoded opcodes.
+    # ------------------------------------------------------------------#
+    def _desc_player_section(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        if operand == 0x0d:
+            return "Green player objectives start (ONLY in scenarios 0-4; turn count at trailing_bytes[45])"
+        if operand == 0x00:
+            return "Red player objectives start (ONLY in scenarios 0-4)"
+        if operand == 0xc0:
+            return "Campaign mode marker (scenario 14 only)"
+        if operand == 0xfe:
+            return "No turn limit (play until objectives complete)"
+        return f"Player objective delimiter: {operand}"
+
+    def _desc_alt_turns(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        return f"Turn limit: {operand} turns"
+
+    def _desc_special_rule(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        if operand == 0xfe:
+            return "No cruise missile attacks allowed"
+        if operand == 0x06:
+            return "Convoy delivery mission active"
+        if operand == 0x00:
+            return "Standard engagement rules"
+        return f"Special rule: code {operand}"
+
+    def _desc_task_force(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        if operand == 0xfe:
+            return "All task forces must survive"
+        if operand == 0x00:
+            return "Task force objective (no specific task force)"
+        return f"Task force survival/destination (ref: {operand})"
+
+    def _desc_zone(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        if operand == 254:
+            region_name = "ALL zones (special value 0xfe)"
+        elif operand < len(region_names):
+            region_name = region_names[operand]
+        else:
+            decoded = self._decode_multizone_operand(opcode, operand)
+            region_name = decoded if decoded else f"zone/condition {operand} (encoding unknown)"
+        return f"Control or occupy {region_name}"
+
+    def _desc_end(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        if operand > 0:
+            region_name = region_names[operand] if operand < len(region_names) else f"region {operand}"
+            return f"Victory check: {region_name} (END also acts as section separator if more opcodes follow)"
+        return "End of script / Section separator (END(0) = no specific victory region)"
+
+    def _desc_score(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        return f"Victory points objective (ref: {operand})"
+
+    def _desc_ship_dest(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        port_name = self._extract_port_name(operand)
+        if port_name:
+            return f"Ships must reach {port_name}"
+        return f"Ships must reach port (index: {operand})"
+
+    def _desc_base_rule(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        if operand == 0:
+            # BASE_RULE(0) means generic "engage enemy air facilities"
+            # Specific targets (if any) are in narrative text only
+            bases_in_narrative = self._extract_bases_from_narrative()
+            if bases_in_narrative:
+                bases_str = ", ".join(bases_in_narrative)
+                return f"Engage/destroy enemy air facilities: {bases_str}\n" \
+                       f"       (Extracted from narrative - not encoded in opcode)"
+            return "Engage/destroy enemy air facilities (no specific targets encoded)"
+        base_name = self._extract_base_name(operand)
+        if base_name:
+            return f"Airfield/base objective: {base_name}"
+        return f"Airfield/base objective (base ID {operand})"
+
+    def _desc_convoy_port(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        port_name = self._extract_port_name(operand)
+        if port_name:
+            return f"Convoy destination: {port_name}"
+        return f"Convoy destination (port ref: {operand})"
+
+    def _desc_zone_entry(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        if operand < len(region_names):
+            region_name = region_names[operand]
+        else:
+            decoded = self._decode_multizone_operand(opcode, operand)
+            region_name = decoded if decoded else f"zone/condition {operand} (encoding unknown)"
+        return f"Zone entry requirement: {region_name}"
+
+    def _desc_region_rule(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        region_name = region_names[operand] if operand < len(region_names) else f"region {operand}"
+        return f"Region-based victory rule: {region_name}"
+
+    def _desc_convoy_fallback(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        return f"Convoy fallback port list (ref: {operand})"
+
+    def _desc_delivery_check(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        return f"Delivery success/failure check (flags: {operand})"
+
+    def _desc_port_list(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        return f"Multi-destination port list (ref: {operand})"
+
+    def _desc_convoy_rule(self, opcode: int, operand: int, region_names: Tuple[str, ...]) -> str:
+        # Check map file for objective ports
+        objective_ports = self._extract_objective_ports()
+        if objective_ports:
+            port_list = ", ".join(objective_ports)
+            return f"Ships must reach: {port_list}"
+        return f"Convoy delivery rule (flags: {operand})"
+
+    _DESC_HANDLERS = {
+        0x00: _desc_end,
+        0x01: _desc_player_section,
+        0x03: _desc_score,
+        0x04: _desc_convoy_rule,
+        0x05: _desc_special_rule,
+        0x06: _desc_ship_dest,
+        0x09: _desc_zone,
+        0x0a: _desc_zone,
+        0x0c: _desc_task_force,
+        0x0e: _desc_base_rule,
+        0x18: _desc_convoy_port,
+        0x29: _desc_region_rule,
+        0x2d: _desc_alt_turns,
+        0x3a: _desc_convoy_fallback,
+        0x3c: _desc_delivery_check,
+        0x3d: _desc_port_list,
+        0xbb: _desc_zone_entry,
+    }
+
+    def _decode_opcode_description(
+        self, opcode: int, operand: int, region_names: Tuple[str, ...] = ()
+    ) -> str:
         """Decode a single opcode/operand pair into a human-readable description.
 
-        This decodes the actual meaning based on the operand value, not just the
-        generic opcode description.
+        This decodes the actual meaning based on the operand value, not just
+        the generic opcode description. ``region_names`` is the flattened name
+        table the caller hoisted out of its loop. Known opcodes dispatch
+        through _DESC_HANDLERS; anything else falls back to the generic
+        OPCODE_TABLE text.
         """
-        if opcode == 0x01:  # PLAYER_SECTION
-            if operand == 0x0d:
-                return "Green player objectives start (ONLY in scenarios 0-4; turn count at trailing_bytes[45])"
-            elif operand == 0x00:
-                return "Red player objectives start (ONLY in scenarios 0-4)"
-            elif operand == 0xc0:
-                return "Campaign mode marker (scenario 14 only)"
-            elif operand == 0xfe:
-                return "No turn limit (play until objectives complete)"
-            else:
-                return f"Player objective delimiter: {operand}"
-
-        elif opcode == 0x2d:  # ALT_TURNS
-            return f"Turn limit: {operand} turns"
-
-        elif opcode == 0x05:  # SPECIAL_RULE
-            if operand == 0xfe:
-                return "No cruise missile attacks allowed"
-            elif operand == 0x06:
-                return "Convoy delivery mission active"
-            elif operand == 0x00:
-                return "Standard engagement rules"
-            else:
-                return f"Special rule: code {operand}"
+        handler = self._DESC_HANDLERS.get(opcode)
+        if handler is not None:
+            return handler(self, opcode, operand, region_names)
 
-        elif opcode == 0x0c:  # TASK_FORCE
-            if operand == 0xfe:
-                return "All task forces must survive"
-            elif operand == 0x00:
-                return "Task force objective (no specific task force)"
-            else:
-                return f"Task force survival/destination (ref: {operand})"
-
-        elif opcode == 0x09 or opcode == 0x0a:  # ZONE_CONTROL/CHECK
-            if operand == 254:
-                region_name = "ALL zones (special value 0xfe)"
-            elif self.map_file and operand < len(self.map_file.regions):
-                region_name = self._region_name(operand)
-            else:
-                decoded = self._decode_multizone_operand(opcode, operand)
-                region_name = decoded if decoded else f"zone/condition {operand} (encoding unknown)"
-            return f"Control or occupy {region_name}"
-
-        elif opcode == 0x00:  # END
-            if operand > 0:
-                region_name = self._region_name(operand) if self.map_file and operand < len(self.map_file.regions) else f"region {operand}"
-                return f"Victory check: {region_name} (END also acts as section separator if more opcodes follow)"
-            else:
-                return "End of script / Section separator (END(0) = no specific victory region)"
-
-        elif opcode == 0x03:  # SCORE
-            return f"Victory points objective (ref: {operand})"
-
-        elif opcode == 0x06:  # SHIP_DEST
-            port_name = self._extract_port_name(operand)
-            if port_name:
-                return f"Ships must reach {port_name}"
-            else:
-                return f"Ships must reach port (index: {operand})"
-
-        elif opcode == 0x0e:  # BASE_RULE
-            if operand == 0:
-                # BASE_RULE(0) means generic "engage enemy air facilities"
-                # Specific targets (if any) are in narrative text only
-                bases_in_narrative = self._extract_bases_from_narrative()
-                if bases_in_narrative:
-                    bases_str = ", ".join(bases_in_narrative)
-                    return f"Engage/destroy enemy air facilities: {bases_str}\n" \
-                           f"       (Extracted from narrative - not encoded in opcode)"
-                else:
-                    return "Engage/destroy enemy air facilities (no specific targets encoded)"
-            base_name = self._extract_base_name(operand)
-            if base_name:
-                return f"Airfield/base objective: {base_name}"
-            else:
-                return f"Airfield/base objective (base ID {operand})"
-
-        elif opcode == 0x18:  # CONVOY_PORT
-            port_name = self._extract_port_name(operand)
-            if port_name:
-                return f"Convoy destination: {port_name}"
-            else:
-                return f"Convoy destination (port ref: {operand})"
-
-        elif opcode == 0xbb:  # ZONE_ENTRY
-            if self.map_file and operand < len(self.map_file.regions):
-                region_name = self._region_name(operand)
-            else:
-                decoded = self._decode_multizone_operand(opcode, operand)
-                region_name = decoded if decoded else f"zone/condition {operand} (encoding unknown)"
-            return f"Zone entry requirement: {region_name}"
-
-        elif opcode == 0x29:  # REGION_RULE
-            region_name = self._region_name(operand) if self.map_file and operand < len(self.map_file.regions) else f"region {operand}"
-            return f"Region-based victory rule: {region_name}"
-
-        elif opcode == 0x3a:  # CONVOY_FALLBACK
-            return f"Convoy fallback port list (ref: {operand})"
-
-        elif opcode == 0x3c:  # DELIVERY_CHECK
-            return f"Delivery success/failure check (flags: {operand})"
-
-        elif opcode == 0x3d:  # PORT_LIST
-            return f"Multi-destination port list (ref: {operand})"
-
-        elif opcode == 0x04:  # CONVOY_RULE
-            # Check map file for objective ports
-            objective_ports = self._extract_objective_ports()
-            if objective_ports:
-                port_list = ", ".join(objective_ports)
-                return f"Ships must reach: {port_list}"
-            else:
-                return f"Convoy delivery rule (flags: {operand})"
-
-        elif opcode in OPCODE_MAP:
-            _, _, description = OPCODE_MAP[opcode]
-            return f"{description} (param: {operand})"
-
-        else:
-            return f"Unknown opcode 0x{opcode:02x}, operand {operand}"
+        entry = OPCODE_TABLE[opcode]
+        if entry is not None:
+            return f"{entry[2]} (param: {operand})"
+        return f"Unknown opcode 0x{opcode:02x}, operand {operand}"
 
     def _parse_objective_script(self, trailing_bytes: bytes) -> List[Tuple[int, int]]:
         """Parse objective script from trailing bytes into (opcode, operand) tuples.
 
         Uses the proper parser that skips metadata strings and finds the actual
-        objective script after the difficulty token.
+        objective script after the difficulty token. Results are memoized per
+        trailing-bytes object; callers get a fresh list they may mutate.
+        """
+        entry = self._parsed_script_cache.get(id(trailing_bytes))
+        if entry is not None and entry[0] is trailing_bytes:
+            return [word for word in entry[1]]
+
+        script = parse_objective_script_proper(trailing_bytes)
+        if len(self._parsed_script_cache) > 256:
+            self._parsed_script_cache.clear()
+        self._parsed_script_cache[id(trailing_bytes)] = (trailing_bytes, tuple(script))
+        return script
+
+    def _script_offset(self, blob: bytes) -> Optional[int]:
+        """Return objective_script_offset(blob), memoized per blob identity.
+
+        Same identity scheme as the parsed-script cache: the editors always
+        replace trailing_bytes with a fresh object, so a matching id plus a
+        held reference means the offset is still valid.
         """
-        return parse_objective_script_proper(trailing_bytes)
+        key = id(blob)
+        cached = self._script_offset_cache.get(key)
+        if cached is not None and cached[0] is blob:
+            return cached[1]
+        offset = objective_script_offset(blob)
+        if len(self._script_offset_cache) > 256:
+            self._script_offset_cache.clear()
+        self._script_offset_cache[key] = (blob, offset)
+        return offset
 
     def _encode_objective_script(self, original_trailing_bytes: bytes, script: List[Tuple[int, int]]) -> bytes:
         """Encode objective script back to trailing bytes, preserving metadata.
@@ -2138,116 +2608,280 @@ class ScenarioEditorApp:
         The trailing bytes contain metadata strings followed by the objective script.
         This function preserves the metadata portion and only replaces the script.
         """
-        # Find where the script starts in the original bytes
-        script_bytes = objective_script_bytes(original_trailing_bytes)
-        if script_bytes:
-            # Calculate the offset where script starts
-            script_offset = len(original_trailing_bytes) - len(script_bytes)
+        # Find where the script starts in the original bytes; the offset helper
+        # avoids copying the whole script tail just to measure it.
+        script_offset = self._script_offset(original_trailing_bytes)
+        if script_offset is not None:
             metadata_portion = original_trailing_bytes[:script_offset]
         else:
             # No script found, keep all as metadata
             metadata_portion = original_trailing_bytes
 
-        # Encode the new script
-        words = [(opcode << 8) | operand for opcode, operand in script]
-        new_script_bytes = struct.pack("<" + "H" * len(words), *words)
+        # Encode the new script; array builds the 16-bit buffer in C without
+        # a per-script format string or varargs splat.
+        words = array("H", ((opcode << 8) | operand for opcode, operand in script))
+        if sys.byteorder != "little":
+            words.byteswap()
+        new_script_bytes = words.tobytes()
 
         # Combine metadata + new script
         return metadata_portion + new_script_bytes
 
     def _format_operand(self, operand: int) -> str:
         """Format an operand value with special value notation."""
-        if operand in SPECIAL_OPERANDS:
-            return f"{operand} ({SPECIAL_OPERANDS[operand]})"
+        if 0 <= operand < 256:
+            return _OPERAND_LABELS[operand]
         return str(operand)
 
+    # ------------------------------------------------------------------#
+    # Objective-opcode render handlers
+    #
+    # Each handler returns the formatted line(s) for one opcode so the
+    # render loop can do a single insert + tag_add instead of repeating
+    # that scaffolding in every elif branch. Opcodes that mutate renderer
+    # state (player sections, END separators, convoy 0x05, BASE_RULE
+    # hints) stay inline in the render loop.
+    # ------------------------------------------------------------------#
+    def _h_alt_turns(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        return f"• Turn limit: {operand} turns\n"
+
+    def _h_task_force(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        if operand == 0xfe:
+            return "• All task forces must survive\n"
+        if operand == 0x00:
+            return "• Task force objective (no specific task force reference)\n"
+        return f"• Task force must survive/reach destination (ref: {operand})\n"
+
+    def _h_zone(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        if operand == 254:
+            region_name = "ALL zones (special value 0xfe)"
+        elif self.map_file and operand < len(self.map_file.regions):
+            region_name = self._region_name(operand)
+        else:
+            decoded = self._decode_multizone_operand(opcode, operand)
+            region_name = decoded if decoded else f"zone/condition {operand} (encoding unknown)"
+        return f"• Control or occupy {region_name}\n"
+
+    def _h_score(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        return (
+            "• Victory points: Destroy as many enemy units as possible\n"
+            f"    (VP reference: {operand} - see narrative text for specifics)\n"
+        )
+
+    def _h_ship_dest(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        port_name = self._extract_port_name(operand)
+        if port_name:
+            return f"• Ships must reach {port_name}\n"
+        return f"• Ships must reach port (index: {operand})\n"
+
+    def _h_convoy_port(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        port_name = self._extract_port_name(operand)
+        convoy_ships = self._extract_convoy_ship_names()
+        if convoy_ships and port_name:
+            ship_list = ", ".join(convoy_ships)
+            return f"• Convoy objective: {ship_list} must reach {port_name}\n"
+        lines = []
+        if convoy_ships:
+            lines.append(f"• Convoy ships: {', '.join(convoy_ships)}\n")
+        if port_name:
+            lines.append(f"• Convoy destination: {port_name}\n")
+        else:
+            lines.append(f"• Convoy destination (port ref: {operand})\n")
+        return "".join(lines)
+
+    def _h_zone_entry(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        if self.map_file and operand < len(self.map_file.regions):
+            region_name = self._region_name(operand)
+        else:
+            decoded = self._decode_multizone_operand(opcode, operand)
+            region_name = decoded if decoded else f"zone/condition {operand} (encoding unknown)"
+        return f"• Zone entry requirement: {region_name}\n"
+
+    def _h_region(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        region_name = (
+            self._region_name(operand)
+            if self.map_file and operand < len(self.map_file.regions)
+            else f"region {operand}"
+        )
+        return f"• Region-based victory rule: {region_name}\n"
+
+    def _h_convoy_fallback(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        return f"• Convoy fallback port list (ref: {operand})\n"
+
+    def _h_delivery(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        return f"• Delivery success/failure check (flags: {operand})\n"
+
+    def _h_convoy_rule(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        objective_ports = self._extract_objective_ports()
+        if objective_ports:
+            return (
+                f"• Ships must reach: {', '.join(objective_ports)}\n"
+                "    (Objective ports marked in map file with SHIP_DEST(251))\n"
+            )
+        text = f"• Convoy delivery rule (flags: {operand})\n"
+        if not flags.get("has_convoy_port") and not flags.get("has_ship_dest"):
+            text += "    ⚠ Destinations only specified in narrative text\n"
+        return text
+
+    def _h_port_list(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        return f"• Multi-destination port list (ref: {operand})\n"
+
+    def _h_default(self, opcode: int, operand: int, flags: Dict[str, bool]) -> str:
+        entry = OPCODE_TABLE[opcode]
+        if entry is not None:
+            return f"• {entry[2]} (param: {operand})\n"
+        return f"• Unknown: opcode 0x{opcode:02x}, operand {operand}\n"
+
+    _RENDER_HANDLERS = {
+        0x03: _h_score,
+        0x04: _h_convoy_rule,
+        0x06: _h_ship_dest,
+        0x09: _h_zone,
+        0x0a: _h_zone,
+        0x0c: _h_task_force,
+        0x18: _h_convoy_port,
+        0x29: _h_region,
+        0x2d: _h_alt_turns,
+        0x3a: _h_convoy_fallback,
+        0x3c: _h_delivery,
+        0x3d: _h_port_list,
+        0xbb: _h_zone_entry,
+    }
+
+    @staticmethod
+    def _prescan_script(script: List[Tuple[int, int]]) -> Dict[str, object]:
+        """Collect the script-wide facts both renderers need in one pass.
+
+        The renderers previously ran five separate any()/next() scans plus an
+        END-search loop over the same script before their main loops. The
+        returned dict doubles as the ``flags`` argument for the shared opcode
+        handlers, which only read the has_convoy_port/has_ship_dest keys.
+
+        ``end_zero_index`` is the index of the first END word when more words
+        follow it (the implicit Green/Red section separator), and
+        ``first_convoy_port`` is the operand of the first CONVOY_PORT word.
+        """
+        has_green = has_red = has_campaign = False
+        has_convoy_port = has_ship_dest = False
+        first_convoy_port: Optional[int] = None
+        end_zero_index: Optional[int] = None
+        seen_end = False
+        last = len(script) - 1
+        for idx, (op, oper) in enumerate(script):
+            if op == 0x01:
+                if oper == 0x0d:
+                    has_green = True
+                elif oper == 0x00:
+                    has_red = True
+                elif oper == 0xc0:
+                    has_campaign = True
+            elif op == 0x18:
+                has_convoy_port = True
+                if first_convoy_port is None:
+                    first_convoy_port = oper
+            elif op == 0x06:
+                has_ship_dest = True
+            elif op == 0x00 and not seen_end:
+                seen_end = True
+                if idx < last:
+                    end_zero_index = idx
+        return {
+            "has_green_marker": has_green,
+            "has_red_marker": has_red,
+            "has_campaign_marker": has_campaign,
+            "has_convoy_port": has_convoy_port,
+            "has_ship_dest": has_ship_dest,
+            "first_convoy_port": first_convoy_port,
+            "end_zero_index": end_zero_index,
+        }
+
     def _decode_objectives(self, script: List[Tuple[int, int]], record: ScenarioRecord) -> str:
         """Decode objective script into human-readable text."""
         if not script:
             return "No objective script found in trailing bytes."
 
-        lines = []
+        lines: List[str] = []
+        # Local bindings shave a LOAD_ATTR off every emitted line; the
+        # renderer runs on each scenario click.
+        append = lines.append
+        extend = lines.extend
 
         # Add descriptive objectives text from SCENARIO.DAT first
         if record.objectives and record.objectives.strip():
-            lines.append("═══════════════════════════════════════════════════")
-            lines.append("SCENARIO OBJECTIVES (Descriptive Text)")
-            lines.append("═══════════════════════════════════════════════════")
-            lines.append("")
-            lines.append(record.objectives.strip())
-            lines.append("")
-            lines.append("═══════════════════════════════════════════════════")
-            lines.append("BINARY OPCODE IMPLEMENTATION")
-            lines.append("═══════════════════════════════════════════════════")
-            lines.append("")
+            extend((
+                _SEP,
+                _HDR_OBJECTIVES,
+                _SEP,
+                "",
+                record.objectives.strip(),
+                "",
+                _SEP,
+                _HDR_BINARY,
+                _SEP,
+                "",
+            ))
 
         # Extract turn count from byte offset 45 in trailing bytes
         turn_count_from_byte45 = None
         if len(record.trailing_bytes) > 45:
             turn_count_from_byte45 = record.trailing_bytes[45]
-            lines.append(f"**Turn Limit: {turn_count_from_byte45} turns**")
-            lines.append("")
+            append(f"**Turn Limit: {turn_count_from_byte45} turns**")
+            append("")
 
         # Track if we find turn-related opcodes
         found_turns_01 = False
         found_alt_turns = False
         current_player = None  # Track which player's objectives we're in
 
-        # Pre-scan for convoy-related opcodes and section markers
-        has_convoy_rule = any(op == 0x05 and oper == 0x06 for op, oper in script)
-        has_convoy_port = any(op == 0x18 for op, oper in script)
-        has_ship_dest = any(op == 0x06 for op, oper in script)
-        has_explicit_red_marker = any(op == 0x01 and oper == 0x00 for op, oper in script)
-        has_explicit_green_marker = any(op == 0x01 and oper == 0x0d for op, oper in script)
-
-        # Pre-scan to find END opcode as potential section separator
-        # This can be END(0), END(1), or any END with opcodes after it
-        end_zero_index = None
-        for idx, (op, oper) in enumerate(script):
-            if op == 0x00:
-                # Check if there are more opcodes after this END
-                if idx + 1 < len(script):
-                    end_zero_index = idx
-                break
+        # Pre-scan for convoy-related opcodes and section markers (one pass)
+        script_flags = self._prescan_script(script)
+        has_convoy_port = script_flags["has_convoy_port"]
+        has_ship_dest = script_flags["has_ship_dest"]
+        has_explicit_red_marker = script_flags["has_red_marker"]
+        has_explicit_green_marker = script_flags["has_green_marker"]
+        end_zero_index = script_flags["end_zero_index"]
 
         # For scenarios without any PLAYER_SECTION markers, default to Green before END, Red after
         if not has_explicit_green_marker and not has_explicit_red_marker and end_zero_index is not None:
             current_player = "Green"
 
+        # Hoisted out of the loop: the region-bound guard is re-tested by
+        # several branches per word.
+        regions_len = len(self.map_file.regions) if self.map_file else 0
+
         for idx, (opcode, operand) in enumerate(script):
             if opcode == 0x01:  # PLAYER_SECTION - player objective delimiter
                 found_turns_01 = True
                 if operand == 0x0d:
-                    lines.append("")
-                    lines.append("═══ GREEN PLAYER OBJECTIVES ═══")
+                    append("")
+                    append(_GREEN_HEADER)
                     current_player = "Green"
                 elif operand == 0x00:
-                    lines.append("")
-                    lines.append("═══ RED PLAYER OBJECTIVES ═══")
+                    append("")
+                    append(_RED_HEADER)
                     current_player = "Red"
                 elif operand == 0xfe:
-                    lines.append("• No turn limit (play until objectives complete)")
+                    append("• No turn limit (play until objectives complete)")
                 else:
-                    lines.append(f"• Player objective delimiter: {operand}")
+                    append(f"• Player objective delimiter: {operand}")
 
             elif opcode == 0x2d:  # ALT_TURNS
                 found_alt_turns = True
-                lines.append(f"• Turn limit: {operand} turns")
+                append(f"• Turn limit: {operand} turns")
                 if turn_count_from_byte45 and turn_count_from_byte45 != operand:
-                    lines.append(f"  ⚠ WARNING: Mismatch detected!")
+                    append(f"  ⚠ WARNING: Mismatch detected!")
 
             elif opcode == 0x05:  # SPECIAL_RULE
                 if operand == 0xfe:
-                    lines.append("• Special: No cruise missile attacks allowed")
+                    append("• Special: No cruise missile attacks allowed")
                 elif operand == 0x06:
                     # Extract convoy ship names from MAP data
                     convoy_ships = self._extract_convoy_ship_names()
 
                     # Find destination if CONVOY_PORT exists in script
-                    convoy_port_opcode = next((o for o in script if o[0] == 0x18), None)
                     destination = None
-                    if convoy_port_opcode:
-                        destination = self._extract_port_name(convoy_port_opcode[1])
+                    if has_convoy_port:
+                        destination = self._extract_port_name(script_flags["first_convoy_port"])
 
                     # If no explicit destination in script, check map file for objective ports
                     objective_ports = []
@@ -2257,82 +2891,47 @@ class ScenarioEditorApp:
                     # Build convoy objective description
                     if convoy_ships and destination:
                         ship_list = ", ".join(convoy_ships)
-                        lines.append(f"• Convoy objective: {ship_list} must reach {destination}")
+                        append(f"• Convoy objective: {ship_list} must reach {destination}")
                     elif convoy_ships:
                         ship_list = ", ".join(convoy_ships)
-                        lines.append(f"• Convoy objective: {ship_list}")
+                        append(f"• Convoy objective: {ship_list}")
                         if objective_ports:
                             port_list = ", ".join(objective_ports)
-                            lines.append(f"    → Ships must reach: {port_list}")
-                            lines.append("    (Objective ports marked in map file with SHIP_DEST(251))")
+                            append(f"    → Ships must reach: {port_list}")
+                            append("    (Objective ports marked in map file with SHIP_DEST(251))")
                         else:
-                            lines.append("    ⚠ WARNING: No CONVOY_PORT or SHIP_DEST opcode found")
-                            lines.append("    Destination only specified in narrative text above")
+                            append("    ⚠ WARNING: No CONVOY_PORT or SHIP_DEST opcode found")
+                            append("    Destination only specified in narrative text above")
                     else:
-                        lines.append("• Special: Convoy/ship delivery mission active")
+                        append("• Special: Convoy/ship delivery mission active")
                         if objective_ports:
                             port_list = ", ".join(objective_ports)
-                            lines.append(f"    → Ships must reach: {port_list}")
-                            lines.append("    (Objective ports marked in map file with SHIP_DEST(251))")
+                            append(f"    → Ships must reach: {port_list}")
+                            append("    (Objective ports marked in map file with SHIP_DEST(251))")
                         elif not has_convoy_port and not has_ship_dest:
-                            lines.append("    ⚠ WARNING: No CONVOY_PORT or SHIP_DEST opcode found")
-                            lines.append("    Destination only specified in narrative text above")
-                elif operand == 0x00:
-                    lines.append("• Special: Standard engagement rules")
-                else:
-                    lines.append(f"• Special rule: code {operand}")
-
-            elif opcode == 0x0c:  # TASK_FORCE
-                if operand == 0xfe:
-                    lines.append("• All task forces must survive")
+                            append("    ⚠ WARNING: No CONVOY_PORT or SHIP_DEST opcode found")
+                            append("    Destination only specified in narrative text above")
                 elif operand == 0x00:
-                    lines.append("• Task force objective (no specific task force reference)")
+                    append("• Special: Standard engagement rules")
                 else:
-                    lines.append(f"• Task force must survive/reach destination (ref: {operand})")
-
-            elif opcode == 0x09 or opcode == 0x0a:  # ZONE_CONTROL/CHECK
-                if operand == 254:
-                    region_name = "ALL zones (special value 0xfe)"
-                elif self.map_file and operand < len(self.map_file.regions):
-                    region_name = self._region_name(operand)
-                else:
-                    # Try to decode multi-zone encoding
-                    decoded = self._decode_multizone_operand(opcode, operand)
-                    if decoded:
-                        region_name = decoded
-                    else:
-                        region_name = f"zone/condition {operand} (encoding unknown)"
-                lines.append(f"• Control or occupy {region_name}")
+                    append(f"• Special rule: code {operand}")
 
             elif opcode == 0x00:  # END
                 if end_zero_index is not None and idx == end_zero_index:
                     # END(any value) with more opcodes after it - treat as Red Player section separator
                     # This handles scenarios like #3 which use END(1) instead of END(0)
                     if not has_explicit_red_marker and current_player == "Green":
-                        lines.append("")
-                        lines.append("═══ RED PLAYER OBJECTIVES ═══")
+                        append("")
+                        append(_RED_HEADER)
                         current_player = "Red"
                     # When END is a section separator, optionally show victory region
                     if operand > 0:
-                        region_name = self._region_name(operand) if self.map_file and operand < len(self.map_file.regions) else f"region {operand}"
-                        lines.append(f"    [Victory check region: {region_name}]")
+                        region_name = self._region_label(operand, regions_len)
+                        append(f"    [Victory check region: {region_name}]")
                 elif operand > 0:
-                    region_name = self._region_name(operand) if self.map_file and operand < len(self.map_file.regions) else f"region {operand}"
-                    lines.append(f"• Victory check region: {region_name}")
-                    lines.append("    (May be global end-game trigger, not player-specific objective)")
-
-            elif opcode == 0x03:  # SCORE
-                # Provide generic description since VP table format is undocumented
-                vp_desc = "Destroy as many enemy units as possible"
-                lines.append(f"• Victory points: {vp_desc}")
-                lines.append(f"    (VP reference: {operand} - see narrative text for specifics)")
-
-            elif opcode == 0x06:  # SHIP_DEST
-                port_name = self._extract_port_name(operand)
-                if port_name:
-                    lines.append(f"• Ships must reach {port_name}")
-                else:
-                    lines.append(f"• Ships must reach port (index: {operand})")
+                    region_name = self._region_label(operand, regions_len)
+                    append(f"• Victory check region: {region_name}")
+                    append("    (May be global end-game trigger, not player-specific objective)")
 
             elif opcode == 0x0e:  # BASE_RULE
                 base_name = self._extract_base_name(operand)
@@ -2345,77 +2944,26 @@ class ScenarioEditorApp:
                     action_hint = ""
 
                 if base_name:
-                    lines.append(f"• Airfield/base objective: {base_name}{action_hint}")
+                    append(f"• Airfield/base objective: {base_name}{action_hint}")
                 else:
-                    lines.append(f"• Airfield/base objective (base ID {operand}){action_hint}")
-
-            elif opcode == 0x18:  # CONVOY_PORT
-                port_name = self._extract_port_name(operand)
-                convoy_ships = self._extract_convoy_ship_names()
-
-                if convoy_ships and port_name:
-                    ship_list = ", ".join(convoy_ships)
-                    lines.append(f"• Convoy objective: {ship_list} must reach {port_name}")
-                elif convoy_ships:
-                    ship_list = ", ".join(convoy_ships)
-                    lines.append(f"• Convoy ships: {ship_list}")
-                    if port_name:
-                        lines.append(f"• Convoy destination: {port_name}")
-                    else:
-                        lines.append(f"• Convoy destination (port ref: {operand})")
-                else:
-                    if port_name:
-                        lines.append(f"• Convoy destination: {port_name}")
-                    else:
-                        lines.append(f"• Convoy destination (port ref: {operand})")
-
-            elif opcode == 0xbb:  # ZONE_ENTRY
-                if self.map_file and operand < len(self.map_file.regions):
-                    region_name = self._region_name(operand)
-                else:
-                    # Try to decode multi-zone encoding
-                    decoded = self._decode_multizone_operand(opcode, operand)
-                    if decoded:
-                        region_name = decoded
-                    else:
-                        region_name = f"zone/condition {operand} (encoding unknown)"
-                lines.append(f"• Zone entry requirement: {region_name}")
+                    append(f"• Airfield/base objective (base ID {operand}){action_hint}")
 
             elif opcode == 0x29:  # REGION_RULE
-                if self.map_file and operand < len(self.map_file.regions):
+                if operand < regions_len:
                     region_name = self._region_name(operand)
                 else:
                     region_name = f"region {operand}"
-                    if self.map_file and operand >= len(self.map_file.regions):
+                    if self.map_file is not None:
                         region_name += f" (not found in map)"
-                lines.append(f"• Region-based victory rule: {region_name}")
-
-            elif opcode == 0x3a:  # CONVOY_FALLBACK
-                lines.append(f"• Convoy fallback port list (ref: {operand})")
-
-            elif opcode == 0x3c:  # DELIVERY_CHECK
-                lines.append(f"• Delivery success/failure check (flags: {operand})")
-
-            elif opcode == 0x04:  # CONVOY_RULE
-                # Check map file for objective ports
-                objective_ports = self._extract_objective_ports()
-                if objective_ports:
-                    port_list = ", ".join(objective_ports)
-                    lines.append(f"• Ships must reach: {port_list}")
-                    lines.append("    (Objective ports marked in map file with SHIP_DEST(251))")
-                else:
-                    lines.append(f"• Convoy delivery rule (flags: {operand})")
-                    if not has_convoy_port and not has_ship_dest:
-                        lines.append("    ⚠ Destinations only specified in narrative text")
+                append(f"• Region-based victory rule: {region_name}")
 
-            elif opcode == 0x3d:  # PORT_LIST
-                lines.append(f"• Multi-destination port list (ref: {operand})")
-
-            elif opcode in OPCODE_MAP:
-                mnemonic, _, description = OPCODE_MAP[opcode]
-                lines.append(f"• {description} (param: {operand})")
             else:
-                lines.append(f"• Unknown: opcode 0x{opcode:02x}, operand {operand}")
+                # Stateless opcodes share the renderer's handler table; only
+                # branches that read or mutate section state (player markers,
+                # END separators, convoy 0x05, BASE_RULE hints, the REGION_RULE
+                # map-mismatch note) stay inline above.
+                handler = self._RENDER_HANDLERS.get(opcode, ScenarioEditorApp._h_default)
+                extend(handler(self, opcode, operand, script_flags).rstrip("\n").split("\n"))
 
         return "\n".join(lines)
 
@@ -2428,185 +2976,198 @@ class ScenarioEditorApp:
         Returns:
             Dict with 'green' and 'red' keys containing the respective objective text.
         """
-        import re
-
         green_objectives = ""
         red_objectives = ""
 
         # Look for "Green Player:" and "Red Player:" markers (case-insensitive)
-        # Match everything until the next player marker or end of string
-        green_match = re.search(
-            r'Green\s+Player:\s*(.+?)(?=Red\s+Player:|$)',
-            objectives_text,
-            re.DOTALL | re.IGNORECASE
-        )
-        red_match = re.search(
-            r'Red\s+Player:\s*(.+?)$',
-            objectives_text,
-            re.DOTALL | re.IGNORECASE
-        )
-
-        if green_match:
-            green_objectives = green_match.group(1).strip()
-        if red_match:
-            red_objectives = red_match.group(1).strip()
+        # and slice everything up to the next marker or end of string. The
+        # retail text always spells the markers with a single space, so a
+        # lowercased find beats running the regex engine here.
+        lowered = objectives_text.lower()
+        green_pos = lowered.find("green player:")
+        red_pos = lowered.find("red player:")
+
+        if green_pos != -1:
+            green_start = green_pos + len("green player:")
+            green_end = red_pos if red_pos > green_pos else None
+            green_objectives = objectives_text[green_start:green_end].strip()
+        if red_pos != -1:
+            red_objectives = objectives_text[red_pos + len("red player:"):].strip()
 
         return {"green": green_objectives, "red": red_objectives}
 
     def _render_decoded_objectives(self, script: List[Tuple[int, int]], record: ScenarioRecord) -> None:
         """Render decoded objectives with color-coded backgrounds for each player."""
+        # Skip the repaint when nothing feeding it changed: the win-word
+        # editors replace trailing_bytes wholesale and apply_scenario_changes
+        # replaces record.objectives wholesale, so object identity doubles as
+        # the invalidation signal (same scheme as the win-row cache).
+        last = self._decoded_render_key
+        if (
+            last is not None
+            and last[0] is record.trailing_bytes
+            and last[1] is record.objectives
+            and last[2] == id(self.map_file)
+        ):
+            return
+        self._decoded_render_key = (record.trailing_bytes, record.objectives, id(self.map_file))
+
         text_widget = self.decoded_objectives_text
         text_widget.config(state=tk.NORMAL)
         text_widget.delete("1.0", tk.END)
 
         if not script:
-            text_widget.insert(tk.END, "No objective script found in trailing bytes.")
+            text_widget.insert("1.0", "No objective script found in trailing bytes.")
             text_widget.config(state=tk.DISABLED)
             return
 
-        # Check if this scenario has explicit player section markers
-        has_explicit_red_marker = any(op == 0x01 and oper == 0x00 for op, oper in script)
-        has_explicit_green_marker = any(op == 0x01 and oper == 0x0d for op, oper in script)
-        has_campaign_marker = any(op == 0x01 and oper == 0xc0 for op, oper in script)
+        # The body is accumulated in Python and written with a single insert;
+        # line positions are tracked here so tag indices can be computed
+        # without a Tcl round-trip per segment. Every emitted segment ends at
+        # a line boundary, so "{line}.0" marks are exact. Tag ranges are
+        # applied at the end, one variadic tag_add per tag.
+        buf: List[str] = []
+        line_no = 1
+        tag_ranges: List[Tuple[str, str, str]] = []
+
+        def emit(segment: str) -> None:
+            nonlocal line_no
+            buf.append(segment)
+            line_no += segment.count("\n")
+
+        def mark() -> str:
+            return f"{line_no}.0"
+
+        # Check if this scenario has explicit player section markers (the
+        # single prescan feeds the marker tests, the convoy flags used by the
+        # shared handlers, and the END separator search below)
+        script_flags = self._prescan_script(script)
+        has_explicit_red_marker = script_flags["has_red_marker"]
+        has_explicit_green_marker = script_flags["has_green_marker"]
+        has_campaign_marker = script_flags["has_campaign_marker"]
 
         # For scenarios 5-23 (no player markers), parse and display player objectives from text
         if not (has_explicit_green_marker or has_explicit_red_marker or has_campaign_marker):
             if record.objectives and record.objectives.strip():
                 player_objs = self._parse_player_objectives(record.objectives)
 
-                text_widget.insert(tk.END, "═══════════════════════════════════════════════════\n")
-                text_widget.insert(tk.END, "PLAYER OBJECTIVES (From Narrative Text)\n")
-                text_widget.insert(tk.END, "═══════════════════════════════════════════════════\n\n")
+                emit(_SEP_NL)
+                emit("PLAYER OBJECTIVES (From Narrative Text)\n")
+                emit(_SEP_NL + "\n")
 
                 # Display Green player objectives with color coding
                 if player_objs["green"]:
-                    start_pos = text_widget.index(tk.INSERT)
-                    text_widget.insert(tk.END, "╔═══ GREEN PLAYER OBJECTIVES ═══╗\n")
-                    end_pos = text_widget.index(tk.INSERT)
-                    text_widget.tag_add("green_header", start_pos, end_pos)
+                    start_pos = mark()
+                    emit("╔═══ GREEN PLAYER OBJECTIVES ═══╗\n")
+                    end_pos = mark()
+                    tag_ranges.append(("green_header", start_pos, end_pos))
 
-                    start_pos = text_widget.index(tk.INSERT)
-                    text_widget.insert(tk.END, player_objs["green"] + "\n\n")
-                    text_widget.tag_add("green_bg", start_pos, text_widget.index(tk.INSERT))
+                    start_pos = mark()
+                    emit(player_objs["green"] + "\n\n")
+                    tag_ranges.append(("green_bg", start_pos, mark()))
 
                 # Display Red player objectives with color coding
                 if player_objs["red"]:
-                    start_pos = text_widget.index(tk.INSERT)
-                    text_widget.insert(tk.END, "╔═══ RED PLAYER OBJECTIVES ═══╗\n")
-                    end_pos = text_widget.index(tk.INSERT)
-                    text_widget.tag_add("red_header", start_pos, end_pos)
+                    start_pos = mark()
+                    emit("╔═══ RED PLAYER OBJECTIVES ═══╗\n")
+                    end_pos = mark()
+                    tag_ranges.append(("red_header", start_pos, end_pos))
 
-                    start_pos = text_widget.index(tk.INSERT)
-                    text_widget.insert(tk.END, player_objs["red"] + "\n\n")
-                    text_widget.tag_add("red_bg", start_pos, text_widget.index(tk.INSERT))
+                    start_pos = mark()
+                    emit(player_objs["red"] + "\n\n")
+                    tag_ranges.append(("red_bg", start_pos, mark()))
 
                 # Add explanatory note
-                text_widget.insert(tk.END, "═══════════════════════════════════════════════════\n")
-                text_widget.insert(tk.END, "BINARY OPCODE IMPLEMENTATION\n")
-                text_widget.insert(tk.END, "(Game Rules - Not Player-Specific)\n")
-                text_widget.insert(tk.END, "═══════════════════════════════════════════════════\n\n")
+                emit(_SEP_NL)
+                emit(_HDR_BINARY + "\n")
+                emit("(Game Rules - Not Player-Specific)\n")
+                emit(_SEP_NL + "\n")
 
-                start_pos = text_widget.index(tk.INSERT)
-                text_widget.insert(tk.END, "ℹ️ NOTE: For scenarios 5-23, opcodes encode game rules and victory\n")
-                text_widget.insert(tk.END, "conditions. Player-specific objectives are determined at runtime\n")
-                text_widget.insert(tk.END, "based on unit ownership. See narrative text above for player details.\n\n")
-                text_widget.tag_add("neutral_bg", start_pos, text_widget.index(tk.INSERT))
+                start_pos = mark()
+                emit("ℹ️ NOTE: For scenarios 5-23, opcodes encode game rules and victory\n")
+                emit("conditions. Player-specific objectives are determined at runtime\n")
+                emit("based on unit ownership. See narrative text above for player details.\n\n")
+                tag_ranges.append(("neutral_bg", start_pos, mark()))
 
         else:
             # For scenarios 0-4 with explicit player markers, show traditional display
             if record.objectives and record.objectives.strip():
-                text_widget.insert(tk.END, "═══════════════════════════════════════════════════\n")
-                text_widget.insert(tk.END, "SCENARIO OBJECTIVES (Descriptive Text)\n")
-                text_widget.insert(tk.END, "═══════════════════════════════════════════════════\n\n")
-                text_widget.insert(tk.END, record.objectives.strip() + "\n\n")
-                text_widget.insert(tk.END, "═══════════════════════════════════════════════════\n")
-                text_widget.insert(tk.END, "BINARY OPCODE IMPLEMENTATION\n")
-                text_widget.insert(tk.END, "═══════════════════════════════════════════════════\n\n")
+                emit(_SEP_NL)
+                emit(_HDR_OBJECTIVES + "\n")
+                emit(_SEP_NL + "\n")
+                emit(record.objectives.strip() + "\n\n")
+                emit(_SEP_NL)
+                emit(_HDR_BINARY + "\n")
+                emit(_SEP_NL + "\n")
 
         # Extract turn count from byte offset 45 in trailing bytes
         turn_count_from_byte45 = None
         if len(record.trailing_bytes) > 45:
             turn_count_from_byte45 = record.trailing_bytes[45]
-            text_widget.insert(tk.END, f"**Turn Limit: {turn_count_from_byte45} turns**\n\n")
+            emit(f"**Turn Limit: {turn_count_from_byte45} turns**\n\n")
 
         # Track current player for background coloring
         current_player = None  # None, "Green", or "Red"
         current_bg_tag = None
 
-        # Pre-scan for convoy-related opcodes and section markers
-        has_convoy_rule = any(op == 0x05 and oper == 0x06 for op, oper in script)
-        has_convoy_port = any(op == 0x18 for op, oper in script)
-        has_ship_dest = any(op == 0x06 for op, oper in script)
-        has_explicit_red_marker = any(op == 0x01 and oper == 0x00 for op, oper in script)
-        has_explicit_green_marker = any(op == 0x01 and oper == 0x0d for op, oper in script)
-
-        # Pre-scan to find END opcode as potential section separator
-        # This can be END(0), END(1), or any END with opcodes after it
-        end_zero_index = None
-        for idx, (op, oper) in enumerate(script):
-            if op == 0x00:
-                # Check if there are more opcodes after this END
-                if idx + 1 < len(script):
-                    end_zero_index = idx
-                break
+        has_convoy_port = script_flags["has_convoy_port"]
+        has_ship_dest = script_flags["has_ship_dest"]
+        end_zero_index = script_flags["end_zero_index"]
 
         # For scenarios without any PLAYER_SECTION markers, default to Green before END, Red after
         if not has_explicit_green_marker and not has_explicit_red_marker and end_zero_index is not None:
             current_player = "Green"
             current_bg_tag = "green_bg"
 
+        # Hoisted out of the loop: the region-bound guard is re-tested by
+        # the END branches per word.
+        regions_len = len(self.map_file.regions) if self.map_file else 0
+
         for idx, (opcode, operand) in enumerate(script):
             if opcode == 0x01:  # PLAYER_SECTION - player objective delimiter
                 if operand == 0x0d:
                     # Green player section
                     current_player = "Green"
                     current_bg_tag = "green_bg"
-                    text_widget.insert(tk.END, "\n")
-                    start_pos = text_widget.index(tk.INSERT)
-                    text_widget.insert(tk.END, "═══ GREEN PLAYER OBJECTIVES ═══\n")
-                    end_pos = text_widget.index(tk.INSERT)
-                    text_widget.tag_add("green_header", start_pos, end_pos)
+                    emit("\n")
+                    start_pos = mark()
+                    emit(_GREEN_HEADER_NL)
+                    end_pos = mark()
+                    tag_ranges.append(("green_header", start_pos, end_pos))
 
                 elif operand == 0x00:
                     # Red player section
                     current_player = "Red"
                     current_bg_tag = "red_bg"
-                    text_widget.insert(tk.END, "\n")
-                    start_pos = text_widget.index(tk.INSERT)
-                    text_widget.insert(tk.END, "═══ RED PLAYER OBJECTIVES ═══\n")
-                    end_pos = text_widget.index(tk.INSERT)
-                    text_widget.tag_add("red_header", start_pos, end_pos)
+                    emit("\n")
+                    start_pos = mark()
+                    emit(_RED_HEADER_NL)
+                    end_pos = mark()
+                    tag_ranges.append(("red_header", start_pos, end_pos))
 
                 elif operand == 0xfe:
-                    start_pos = text_widget.index(tk.INSERT)
-                    text_widget.insert(tk.END, "• No turn limit (play until objectives complete)\n")
+                    start_pos = mark()
+                    emit("• No turn limit (play until objectives complete)\n")
                     if current_bg_tag:
-                        text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
+                        tag_ranges.append((current_bg_tag, start_pos, mark()))
                 else:
-                    start_pos = text_widget.index(tk.INSERT)
-                    text_widget.insert(tk.END, f"• Player section marker (operand: {operand})\n")
+                    start_pos = mark()
+                    emit(f"• Player section marker (operand: {operand})\n")
                     if current_bg_tag:
-                        text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x2d:  # ALT_TURNS
-                start_pos = text_widget.index(tk.INSERT)
-                text_widget.insert(tk.END, f"• Turn limit: {operand} turns\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
+                        tag_ranges.append((current_bg_tag, start_pos, mark()))
 
             elif opcode == 0x05:  # SPECIAL_RULE
-                start_pos = text_widget.index(tk.INSERT)
+                start_pos = mark()
                 if operand == 0xfe:
-                    text_widget.insert(tk.END, "• Special: No cruise missile attacks allowed\n")
+                    emit("• Special: No cruise missile attacks allowed\n")
                 elif operand == 0x06:
                     # Extract convoy ship names from MAP data
                     convoy_ships = self._extract_convoy_ship_names()
 
                     # Find destination if CONVOY_PORT exists in script
-                    convoy_port_opcode = next((o for o in script if o[0] == 0x18), None)
                     destination = None
-                    if convoy_port_opcode:
-                        destination = self._extract_port_name(convoy_port_opcode[1])
+                    if has_convoy_port:
+                        destination = self._extract_port_name(script_flags["first_convoy_port"])
 
                     # If no explicit destination in script, check map file for objective ports
                     objective_ports = []
@@ -2616,60 +3177,32 @@ class ScenarioEditorApp:
                     # Build convoy objective description
                     if convoy_ships and destination:
                         ship_list = ", ".join(convoy_ships)
-                        text_widget.insert(tk.END, f"• Convoy objective: {ship_list} must reach {destination}\n")
+                        emit(f"• Convoy objective: {ship_list} must reach {destination}\n")
                     elif convoy_ships:
                         ship_list = ", ".join(convoy_ships)
-                        text_widget.insert(tk.END, f"• Convoy objective: {ship_list}\n")
+                        emit(f"• Convoy objective: {ship_list}\n")
                         if objective_ports:
                             port_list = ", ".join(objective_ports)
-                            text_widget.insert(tk.END, f"    → Ships must reach: {port_list}\n")
-                            text_widget.insert(tk.END, "    (Objective ports marked in map file with SHIP_DEST(251))\n")
+                            emit(f"    → Ships must reach: {port_list}\n")
+                            emit("    (Objective ports marked in map file with SHIP_DEST(251))\n")
                         else:
-                            text_widget.insert(tk.END, "    ⚠ WARNING: No CONVOY_PORT or SHIP_DEST opcode found\n")
-                            text_widget.insert(tk.END, "    Destination only specified in narrative text above\n")
+                            emit("    ⚠ WARNING: No CONVOY_PORT or SHIP_DEST opcode found\n")
+                            emit("    Destination only specified in narrative text above\n")
                     else:
-                        text_widget.insert(tk.END, "• Special: Convoy/ship delivery mission active\n")
+                        emit("• Special: Convoy/ship delivery mission active\n")
                         if objective_ports:
                             port_list = ", ".join(objective_ports)
-                            text_widget.insert(tk.END, f"    → Ships must reach: {port_list}\n")
-                            text_widget.insert(tk.END, "    (Objective ports marked in map file with SHIP_DEST(251))\n")
+                            emit(f"    → Ships must reach: {port_list}\n")
+                            emit("    (Objective ports marked in map file with SHIP_DEST(251))\n")
                         elif not has_convoy_port and not has_ship_dest:
-                            text_widget.insert(tk.END, "    ⚠ WARNING: No CONVOY_PORT or SHIP_DEST opcode found\n")
-                            text_widget.insert(tk.END, "    Destination only specified in narrative text above\n")
-                elif operand == 0x00:
-                    text_widget.insert(tk.END, "• Special: Standard engagement rules\n")
-                else:
-                    text_widget.insert(tk.END, f"• Special rule: code {operand}\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x0c:  # TASK_FORCE
-                start_pos = text_widget.index(tk.INSERT)
-                if operand == 0xfe:
-                    text_widget.insert(tk.END, "• All task forces must survive\n")
+                            emit("    ⚠ WARNING: No CONVOY_PORT or SHIP_DEST opcode found\n")
+                            emit("    Destination only specified in narrative text above\n")
                 elif operand == 0x00:
-                    text_widget.insert(tk.END, "• Task force objective (no specific task force reference)\n")
-                else:
-                    text_widget.insert(tk.END, f"• Task force must survive/reach destination (ref: {operand})\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x09 or opcode == 0x0a:  # ZONE_CONTROL/CHECK
-                start_pos = text_widget.index(tk.INSERT)
-                if operand == 254:
-                    region_name = "ALL zones (special value 0xfe)"
-                elif self.map_file and operand < len(self.map_file.regions):
-                    region_name = self._region_name(operand)
+                    emit("• Special: Standard engagement rules\n")
                 else:
-                    # Try to decode multi-zone encoding
-                    decoded = self._decode_multizone_operand(opcode, operand)
-                    if decoded:
-                        region_name = decoded
-                    else:
-                        region_name = f"zone/condition {operand} (encoding unknown)"
-                text_widget.insert(tk.END, f"• Control or occupy {region_name}\n")
+                    emit(f"• Special rule: code {operand}\n")
                 if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
+                    tag_ranges.append((current_bg_tag, start_pos, mark()))
 
             elif opcode == 0x00:  # END
                 if end_zero_index is not None and idx == end_zero_index:
@@ -2678,46 +3211,28 @@ class ScenarioEditorApp:
                     if not has_explicit_red_marker and current_player == "Green":
                         current_player = "Red"
                         current_bg_tag = "red_bg"
-                        text_widget.insert(tk.END, "\n")
-                        start_pos = text_widget.index(tk.INSERT)
-                        text_widget.insert(tk.END, "═══ RED PLAYER OBJECTIVES ═══\n")
-                        end_pos = text_widget.index(tk.INSERT)
-                        text_widget.tag_add("red_header", start_pos, end_pos)
+                        emit("\n")
+                        start_pos = mark()
+                        emit(_RED_HEADER_NL)
+                        end_pos = mark()
+                        tag_ranges.append(("red_header", start_pos, end_pos))
                     # When END is a section separator, optionally show victory region
                     if operand > 0:
-                        start_pos = text_widget.index(tk.INSERT)
-                        region_name = self._region_name(operand) if self.map_file and operand < len(self.map_file.regions) else f"region {operand}"
-                        text_widget.insert(tk.END, f"    [Victory check region: {region_name}]\n")
+                        start_pos = mark()
+                        region_name = self._region_label(operand, regions_len)
+                        emit(f"    [Victory check region: {region_name}]\n")
                         if current_bg_tag:
-                            text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
+                            tag_ranges.append((current_bg_tag, start_pos, mark()))
                 elif operand > 0:
-                    start_pos = text_widget.index(tk.INSERT)
-                    region_name = self._region_name(operand) if self.map_file and operand < len(self.map_file.regions) else f"region {operand}"
-                    text_widget.insert(tk.END, f"• Victory check region: {region_name}\n")
-                    text_widget.insert(tk.END, "    (May be global end-game trigger, not player-specific objective)\n")
+                    start_pos = mark()
+                    region_name = self._region_label(operand, regions_len)
+                    emit(f"• Victory check region: {region_name}\n")
+                    emit("    (May be global end-game trigger, not player-specific objective)\n")
                     if current_bg_tag:
-                        text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x03:  # SCORE
-                start_pos = text_widget.index(tk.INSERT)
-                vp_desc = "Destroy as many enemy units as possible"
-                text_widget.insert(tk.END, f"• Victory points: {vp_desc}\n")
-                text_widget.insert(tk.END, f"    (VP reference: {operand} - see narrative text for specifics)\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x06:  # SHIP_DEST
-                start_pos = text_widget.index(tk.INSERT)
-                port_name = self._extract_port_name(operand)
-                if port_name:
-                    text_widget.insert(tk.END, f"• Ships must reach {port_name}\n")
-                else:
-                    text_widget.insert(tk.END, f"• Ships must reach port (index: {operand})\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
+                        tag_ranges.append((current_bg_tag, start_pos, mark()))
 
             elif opcode == 0x0e:  # BASE_RULE
-                start_pos = text_widget.index(tk.INSERT)
+                start_pos = mark()
                 base_name = self._extract_base_name(operand)
                 # Add contextual hint based on player
                 if current_player == "Red":
@@ -2728,112 +3243,54 @@ class ScenarioEditorApp:
                     action_hint = ""
 
                 if base_name:
-                    text_widget.insert(tk.END, f"• Airfield/base objective: {base_name}{action_hint}\n")
+                    emit(f"• Airfield/base objective: {base_name}{action_hint}\n")
                 else:
-                    text_widget.insert(tk.END, f"• Airfield/base objective (base ID: {operand}){action_hint}\n")
+                    emit(f"• Airfield/base objective (base ID: {operand}){action_hint}\n")
                 if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x18:  # CONVOY_PORT
-                start_pos = text_widget.index(tk.INSERT)
-                port_name = self._extract_port_name(operand)
-                convoy_ships = self._extract_convoy_ship_names()
-
-                if convoy_ships and port_name:
-                    ship_list = ", ".join(convoy_ships)
-                    text_widget.insert(tk.END, f"• Convoy objective: {ship_list} must reach {port_name}\n")
-                elif convoy_ships:
-                    ship_list = ", ".join(convoy_ships)
-                    text_widget.insert(tk.END, f"• Convoy ships: {ship_list}\n")
-                    if port_name:
-                        text_widget.insert(tk.END, f"• Convoy destination: {port_name}\n")
-                    else:
-                        text_widget.insert(tk.END, f"• Convoy destination (port ref: {operand})\n")
-                else:
-                    if port_name:
-                        text_widget.insert(tk.END, f"• Convoy destination: {port_name}\n")
-                    else:
-                        text_widget.insert(tk.END, f"• Convoy destination (port ref: {operand})\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0xbb:  # ZONE_ENTRY
-                start_pos = text_widget.index(tk.INSERT)
-                if self.map_file and operand < len(self.map_file.regions):
-                    region_name = self._region_name(operand)
-                else:
-                    # Try to decode multi-zone encoding
-                    decoded = self._decode_multizone_operand(opcode, operand)
-                    if decoded:
-                        region_name = decoded
-                    else:
-                        region_name = f"zone/condition {operand} (encoding unknown)"
-                text_widget.insert(tk.END, f"• Zone entry requirement: {region_name}\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x29:  # REGION_RULE
-                start_pos = text_widget.index(tk.INSERT)
-                region_name = self._region_name(operand) if self.map_file and operand < len(self.map_file.regions) else f"region {operand}"
-                text_widget.insert(tk.END, f"• Region-based victory rule: {region_name}\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x3a:  # CONVOY_FALLBACK
-                start_pos = text_widget.index(tk.INSERT)
-                text_widget.insert(tk.END, f"• Convoy fallback port list (ref: {operand})\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
+                    tag_ranges.append((current_bg_tag, start_pos, mark()))
 
-            elif opcode == 0x3c:  # DELIVERY_CHECK
-                start_pos = text_widget.index(tk.INSERT)
-                text_widget.insert(tk.END, f"• Delivery success/failure check (flags: {operand})\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x04:  # CONVOY_RULE
-                start_pos = text_widget.index(tk.INSERT)
-                # Check map file for objective ports
-                objective_ports = self._extract_objective_ports()
-                if objective_ports:
-                    port_list = ", ".join(objective_ports)
-                    text_widget.insert(tk.END, f"• Ships must reach: {port_list}\n")
-                    text_widget.insert(tk.END, "    (Objective ports marked in map file with SHIP_DEST(251))\n")
-                else:
-                    text_widget.insert(tk.END, f"• Convoy delivery rule (flags: {operand})\n")
-                    if not has_convoy_port and not has_ship_dest:
-                        text_widget.insert(tk.END, "    ⚠ Destinations only specified in narrative text\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode == 0x3d:  # PORT_LIST
-                start_pos = text_widget.index(tk.INSERT)
-                text_widget.insert(tk.END, f"• Multi-destination port list (ref: {operand})\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
-
-            elif opcode in OPCODE_MAP:
-                start_pos = text_widget.index(tk.INSERT)
-                mnemonic, _, description = OPCODE_MAP[opcode]
-                text_widget.insert(tk.END, f"• {description} (param: {operand})\n")
-                if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
             else:
-                start_pos = text_widget.index(tk.INSERT)
-                text_widget.insert(tk.END, f"• Unknown: opcode 0x{opcode:02x}, operand {operand}\n")
+                handler = self._RENDER_HANDLERS.get(opcode, ScenarioEditorApp._h_default)
+                start_pos = mark()
+                emit(handler(self, opcode, operand, script_flags))
                 if current_bg_tag:
-                    text_widget.tag_add(current_bg_tag, start_pos, text_widget.index(tk.INSERT))
+                    tag_ranges.append((current_bg_tag, start_pos, mark()))
+
+        text_widget.insert("1.0", "".join(buf))
+
+        # Ranges are recorded in document order, so consecutive rows in the
+        # same player section arrive as back-to-back spans of one tag; merge
+        # those runs first (tagging [a,b) then [b,c) equals tagging [a,c))
+        # so each section becomes a single span instead of one per opcode.
+        merged: List[Tuple[str, str, str]] = []
+        for tag, start, end in tag_ranges:
+            if merged and merged[-1][0] == tag and merged[-1][2] == start:
+                merged[-1] = (tag, merged[-1][1], end)
+            else:
+                merged.append((tag, start, end))
+        by_tag: Dict[str, List[str]] = {}
+        for tag, start, end in merged:
+            by_tag.setdefault(tag, []).extend((start, end))
+        for tag, spans in by_tag.items():
+            text_widget.tag_add(tag, *spans)
 
         text_widget.config(state=tk.DISABLED)
 
     def _trailing_words(self, record: ScenarioRecord) -> List[int]:
-        if len(record.trailing_bytes) % 2 != 0:
+        trailing = record.trailing_bytes
+        if len(trailing) % 2 != 0:
             # Pad odd trailing byte count to preserve parsing.
-            return list(struct.unpack("<" + "B" * len(record.trailing_bytes), record.trailing_bytes))
-        if not record.trailing_bytes:
+            return list(trailing)
+        if not trailing:
             return []
-        count = len(record.trailing_bytes) // 2
-        return list(struct.unpack("<" + "H" * count, record.trailing_bytes))
+        # Decode in C via array('H') rather than building an O(n) struct
+        # format string per call; mirrors the encode path in
+        # _encode_objective_script.
+        words = array("H")
+        words.frombytes(trailing)
+        if sys.byteorder != "little":
+            words.byteswap()
+        return words.tolist()
 
     def _on_select_win_word(self, *_args) -> None:
         selection = self.win_tree.selection()
@@ -2858,11 +3315,11 @@ class ScenarioEditorApp:
         record = self._current_record()
         if record is None:
             return
-        index_text = self.win_index_var.get()
-        if not index_text.isdigit():
+        try:
+            index = int(self.win_index_var.get())
+        except ValueError:
             messagebox.showerror("Selection", "Select an opcode to edit.")
             return
-        index = int(index_text)
 
         # Parse opcode
         opcode_text = self.win_opcode_var.get().strip()
@@ -2879,16 +3336,21 @@ class ScenarioEditorApp:
 
         operand = self.win_operand_var.get() & 0xFF
 
-        # Rebuild script
         script = self._parse_objective_script(record.trailing_bytes)
         if index >= len(script):
             messagebox.showerror("Index", "Selected index out of range.")
             return
 
-        script[index] = (opcode, operand)
-
-        # Encode back to trailing bytes, preserving metadata
-        record.trailing_bytes = self._encode_objective_script(record.trailing_bytes, script)
+        # The script sits at a fixed offset at the end of trailing_bytes, so a
+        # single-word edit only needs its two bytes rewritten; no need to
+        # re-encode the whole script.
+        word_offset = self._script_offset(record.trailing_bytes) + index * 2
+        record.trailing_bytes = (
+            record.trailing_bytes[:word_offset]
+            + ((opcode << 8) | operand).to_bytes(2, "little")
+            + record.trailing_bytes[word_offset + 2:]
+        )
+        self._scenario_dirty = True
 
         self.refresh_win_table()
 
@@ -2903,6 +3365,7 @@ class ScenarioEditorApp:
 
         # Encode back, preserving metadata
         record.trailing_bytes = self._encode_objective_script(record.trailing_bytes, script)
+        self._scenario_dirty = True
 
         self.refresh_win_table()
 
@@ -2911,15 +3374,15 @@ class ScenarioEditorApp:
         if record is None:
             return
 
-        index_text = self.win_index_var.get()
-        if not index_text.isdigit():
+        try:
+            index = int(self.win_index_var.get())
+        except ValueError:
             # Remove last opcode if none selected
             script = self._parse_objective_script(record.trailing_bytes)
             if not script:
                 return
             script.pop()
         else:
-            index = int(index_text)
             script = self._parse_objective_script(record.trailing_bytes)
             if index >= len(script):
                 return
@@ -2930,10 +3393,10 @@ class ScenarioEditorApp:
             record.trailing_bytes = self._encode_objective_script(record.trailing_bytes, script)
         else:
             # If no script left, preserve metadata but remove script portion
-            script_bytes = objective_script_bytes(record.trailing_bytes)
-            if script_bytes:
-                script_offset = len(record.trailing_bytes) - len(script_bytes)
+            script_offset = self._script_offset(record.trailing_bytes)
+            if script_offset is not None:
                 record.trailing_bytes = record.trailing_bytes[:script_offset]
+        self._scenario_dirty = True
 
         self.refresh_win_table()
 
@@ -2941,43 +3404,42 @@ class ScenarioEditorApp:
         if not hasattr(self, "icon_listbox"):
             return
 
-        self.icon_listbox.delete(0, tk.END)
         if not self.icon_library:
+            self._fast_listbox_replace(self.icon_listbox, ())
             self.icon_info_var.set(
                 self.icon_load_error or "No counter icons available."
             )
             self.icon_preview_label.configure(image="")
             self.icon_preview_photo = None
+            self._last_preview_key = None
             return
 
+        icon_users = self._icon_template_users()
+
+        items = []
         for icon in self.icon_library:
-            # Try to find which templates use this icon
-            using_templates = []
-            for kind in ["air", "surface", "sub"]:
-                for idx, template in enumerate(self._template_records(kind)):
-                    # Check if template uses this icon
-                    uses_icon = template.icon_index == icon.index
-                    # Submarines use sequential icons: icon = 41 + template_id
-                    if not uses_icon and kind == "sub" and template.icon_index is None and icon.index == 41 + idx:
-                        uses_icon = True
-
-                    if uses_icon:
-                        using_templates.append(f"{template.name[:8]}")
-                        if len(using_templates) >= 2:  # Limit display
-                            break
-                if len(using_templates) >= 2:
-                    break
+            using_templates = icon_users.get(icon.index, [])[:2]
 
             if using_templates:
                 template_hint = f" ({', '.join(using_templates)}...)"
             else:
                 template_hint = ""
 
-            entry = f"[{icon.index:02d}] {icon.width}×{icon.height}{template_hint}"
-            self.icon_listbox.insert(tk.END, entry)
-
-        self.icon_listbox.selection_set(0)
-        self._on_select_icon()
+            items.append(f"[{icon.index:02d}] {icon.width}×{icon.height}{template_hint}")
+        self._fast_listbox_replace(self.icon_listbox, items)
+
+        # Keep the user's selection across refreshes when it still exists;
+        # re-rendering a different icon on an incidental repopulate throws
+        # away the warm preview for no reason.
+        prev = self.selected_icon_index
+        restore = prev if prev is not None and prev < len(self.icon_library) else 0
+        self.icon_listbox.selection_set(restore)
+        self.selected_icon_index = restore
+        # Defer the preview render so the tab paints immediately; going
+        # through the pending guard also skips _on_select_icon's curselection
+        # round-trip since the index is already known.
+        if self._pending_preview is None:
+            self._pending_preview = self.root.after_idle(self._render_pending_preview)
 
     def _on_select_icon(self, *_args) -> None:
         if not self.icon_library:
@@ -2988,13 +3450,32 @@ class ScenarioEditorApp:
             self.selected_icon_index = None
             self.icon_preview_label.configure(image="")
             self.icon_info_var.set("No icon selected.")
+            self._last_preview_key = None
             return
 
         index = selection[0]
         if index >= len(self.icon_library):
             return
         self.selected_icon_index = index
+        # Defer the render so rapid selection changes (drag-scrolling) only
+        # paint the final selection instead of queueing one render apiece.
+        if self._pending_preview is None:
+            self._pending_preview = self.root.after_idle(self._render_pending_preview)
+
+    def _render_pending_preview(self) -> None:
+        self._pending_preview = None
         self._update_icon_preview()
+        # Warm the cache for the neighbouring icons once the preview is up,
+        # so stepping through the list with the arrow keys hits the cache.
+        self.root.after(50, self._prefetch_icon_neighbours)
+
+    def _prefetch_icon_neighbours(self) -> None:
+        if not self.icon_library or self.selected_icon_index is None:
+            return
+        side = self.icon_side_var.get()
+        for neighbour in (self.selected_icon_index - 1, self.selected_icon_index + 1):
+            if 0 <= neighbour < len(self.icon_library):
+                self._get_icon_photo(self.icon_library[neighbour].index, side)
 
     def _update_icon_preview(self) -> None:
         if not self.icon_library or self.selected_icon_index is None:
@@ -3004,18 +3485,55 @@ class ScenarioEditorApp:
 
         icon = self.icon_library[self.selected_icon_index]
         side = self.icon_side_var.get()
+        key = (icon.index, side)
+        if key == self._last_preview_key:
+            return
         photo = self._get_icon_photo(icon.index, side)
         self.icon_preview_photo = photo
         self.icon_preview_label.configure(image=photo)
         self.icon_info_var.set(
             f"Index {icon.index} • {icon.width}×{icon.height} • background={icon.background_index} • side={side}"
         )
+        self._last_preview_key = key
+
+    def _icon_template_users(self) -> Dict[int, List[str]]:
+        """
+        Invert the template->icon mapping so each icon can look up the
+        templates using it with a plain dict access instead of rescanning
+        every template per icon. The index is cached against the library it
+        was built from and rebuilt only after a template reload.
+        """
+
+        cached = self._icon_users_cache
+        if cached is not None and cached[0] is self.template_library:
+            return cached[1]
+
+        icon_users: Dict[int, List[str]] = {}
+        for kind in ("air", "surface", "sub"):
+            for idx, template in enumerate(self._template_records(kind)):
+                effective_icon = template.icon_index
+                # Submarines use sequential icons: icon = 41 + template_id
+                if effective_icon is None and kind == "sub":
+                    effective_icon = 41 + idx
+                if effective_icon is not None:
+                    icon_users.setdefault(effective_icon, []).append(f"{template.name[:8]}")
+
+        self._icon_users_cache = (self.template_library, icon_users)
+        return icon_users
+
+    # Shared miss default for _template_records; hoisted so the hot callers
+    # (unit redraw, icon list) don't allocate a fresh empty list per call.
+    _NO_TEMPLATES: List[TemplateRecord] = []
 
     def _template_records(self, kind: str) -> List[TemplateRecord]:
-        return self.template_library.get(kind, [])
+        return self.template_library.get(kind, self._NO_TEMPLATES)
 
-    def _template_names(self, kind: str) -> List[str]:
-        return [record.name for record in self._template_records(kind)]
+    def _template_names(self, kind: str) -> Tuple[str, ...]:
+        names = self._template_names_cache.get(kind)
+        if names is None:
+            names = tuple(record.name for record in self._template_records(kind))
+            self._template_names_cache[kind] = names
+        return names
 
     def _template_icon_index(self, kind: str, template_id: int) -> Optional[int]:
         records = self._template_records(kind)
@@ -3039,6 +3557,7 @@ class ScenarioEditorApp:
             self.unit_icon_info_var.set(f"Template {unit.template_id} out of range (max {max_id})")
             self.unit_icon_preview_label.configure(image="")
             self.unit_icon_photo = None
+            self._last_unit_preview_key = None
             return
 
         icon_index = self._template_icon_index(kind, unit.template_id)
@@ -3046,40 +3565,106 @@ class ScenarioEditorApp:
             self.unit_icon_info_var.set(f"Template {unit.template_id}: no icon assigned")
             self.unit_icon_preview_label.configure(image="")
             self.unit_icon_photo = None
+            self._last_unit_preview_key = None
             return
 
         if icon_index >= len(self.icon_library):
             self.unit_icon_info_var.set(f"Icon #{icon_index} out of range (max {len(self.icon_library)-1})")
             self.unit_icon_preview_label.configure(image="")
             self.unit_icon_photo = None
+            self._last_unit_preview_key = None
             return
 
         side = unit.owner_raw & 0x03
+        key = (icon_index, side)
+        if key == self._last_unit_preview_key:
+            return
         photo = self._get_icon_photo(icon_index, side)
         self.unit_icon_photo = photo
         self.unit_icon_preview_label.configure(image=photo)
         self.unit_icon_info_var.set(f"Icon #{icon_index} (side {side})")
+        self._last_unit_preview_key = key
 
     def _clear_unit_icon_preview(self) -> None:
         self.unit_icon_info_var.set("Icon: n/a")
         if hasattr(self, "unit_icon_preview_label"):
             self.unit_icon_preview_label.configure(image="")
         self.unit_icon_photo = None
+        self._last_unit_preview_key = None
 
-    def _get_icon_photo(self, icon_index: int, side: int) -> ImageTk.PhotoImage:
-        key = (icon_index, side)
-        if key not in self.icon_photo_cache:
-            icon = self.icon_library[icon_index]
+    ICON_PHOTO_CACHE_LIMIT = 128
 
-            # Calculate scale to normalize icon display size
-            # Target is 104 pixels (26x26 at scale 4), use max dimension to determine scale
-            target_size = 104
-            max_dimension = max(icon.width, icon.height)
-            scale = max(1, round(target_size / max_dimension))
+    def _render_icon_base(
+        self, icon_index: int
+    ) -> Tuple[Image.Image, Optional[Image.Image], int]:
+        """Render (and cache) the side-independent image for an icon.
 
-            image = icon.render_image(side=side, scale=scale)
-            self.icon_photo_cache[key] = ImageTk.PhotoImage(image)
-        return self.icon_photo_cache[key]
+        Returns the base RGBA render, a mask selecting the background pixels
+        that get recoloured per side (None if the pixel data is irregular),
+        and the scale used.
+        """
+        entry = self._icon_base_cache.get(icon_index)
+        if entry is not None:
+            return entry
+
+        icon = self.icon_library[icon_index]
+
+        # Calculate scale to normalize icon display size
+        # Target is 104 pixels (26x26 at scale 4), use max dimension to determine scale
+        target_size = 104
+        max_dimension = max(icon.width, icon.height)
+        scale = max(1, round(target_size / max_dimension))
+
+        base = icon.render_image(side=None, scale=scale)
+        mask_data = bytes(
+            255 if (pix == icon.background_index and pix != 0) else 0
+            for row in icon.pixels
+            for pix in row
+        )
+        mask: Optional[Image.Image] = None
+        if len(mask_data) == icon.width * icon.height:
+            mask = Image.frombytes("L", (icon.width, icon.height), mask_data)
+            if scale > 1:
+                mask = mask.resize((icon.width * scale, icon.height * scale), Image.NEAREST)
+
+        entry = (base, mask, scale)
+        self._icon_base_cache[icon_index] = entry
+        return entry
+
+    def _get_icon_photo(self, icon_index: int, side: int) -> ImageTk.PhotoImage:
+        key = (icon_index, side)
+        photo = self.icon_photo_cache.get(key)
+        if photo is not None:
+            self.icon_photo_cache.move_to_end(key)
+            return photo
+
+        base, mask, scale = self._render_icon_base(icon_index)
+        colour = TEAM_COLOURS.get(side)
+        if colour is None:
+            image = base
+        elif mask is not None:
+            image = base.copy()
+            image.paste((*colour, 255), mask=mask)
+        else:
+            # Irregular pixel rows; fall back to the full per-side render.
+            image = self.icon_library[icon_index].render_image(side=side, scale=scale)
+        # At capacity, recycle the oldest PhotoImage handle in place of
+        # freeing it and registering a new one with Tcl.
+        recycled = None
+        if len(self.icon_photo_cache) >= self.ICON_PHOTO_CACHE_LIMIT:
+            _, recycled = self.icon_photo_cache.popitem(last=False)
+            # Never paste over a photo still pinned to a preview label: the
+            # last-shown-key guards would keep displaying the overwritten
+            # image. Let Tcl free it and register a fresh handle instead.
+            if recycled is self.icon_preview_photo or recycled is self.unit_icon_photo:
+                recycled = None
+        if recycled is not None and (recycled.width(), recycled.height()) == image.size:
+            recycled.paste(image)
+            photo = recycled
+        else:
+            photo = ImageTk.PhotoImage(image)
+        self.icon_photo_cache[key] = photo
+        return photo
 
     # ------------------------------------------------------------------#
     # File dialogs and helpers
@@ -3122,6 +3707,8 @@ class ScenarioEditorApp:
         except Exception as exc:
             messagebox.showerror("Save Error", f"Unable to save scenario file:\n{exc}")
             return
+        self._scenario_dirty = False
+        self._game_dir_index = None
         messagebox.showinfo("Saved", f"Scenario saved to {target}")
 
     def save_map(self) -> None:
@@ -3144,28 +3731,43 @@ class ScenarioEditorApp:
         except Exception as exc:
             messagebox.showerror("Save Error", f"Unable to save map file:\n{exc}")
             return
+        self._map_dirty = False
+        self._game_dir_index = None
         messagebox.showinfo("Saved", f"Map saved to {target}")
 
     def save_all(self) -> None:
-        self.save_scenario()
-        self.save_map()
+        # Skip loaded files with no unsaved edits; re-serializing them would
+        # rewrite identical bytes. Direct Save still writes unconditionally.
+        if self.scenario_file is None or self._scenario_dirty:
+            self.save_scenario()
+        if self.map_file is None or self._map_dirty:
+            self.save_map()
 
     def _current_record(self) -> Optional[ScenarioRecord]:
         if self.scenario_file is None or self.selected_scenario_index is None:
             return None
         return self.scenario_file.records[self.selected_scenario_index]
 
+    def _find_game_file(self, name: str) -> Optional[Path]:
+        """Look up *name* in game_dir case-insensitively via a cached index."""
+        if self._game_dir_index is None:
+            try:
+                self._game_dir_index = {
+                    entry.name.lower(): entry
+                    for entry in self.game_dir.iterdir()
+                    if entry.is_file()
+                }
+            except OSError:
+                self._game_dir_index = {}
+        return self._game_dir_index.get(name.lower())
+
     def _ensure_map_for_scenario(self, record: ScenarioRecord) -> None:
         if not record.scenario_key:
             self.oob_status_var.set("Scenario has no map key; load a map manually.")
             self.oob_map_filename_var.set("")
             return
 
-        candidates = [
-            self.game_dir / f"{record.scenario_key}.DAT",
-            self.game_dir / f"{record.scenario_key.upper()}.DAT",
-        ]
-        path = next((candidate for candidate in candidates if candidate.exists()), None)
+        path = self._find_game_file(f"{record.scenario_key}.DAT")
         if path is None:
             self.oob_status_var.set(
                 f"Map file for '{record.scenario_key}' not found; load a map manually."
@@ -3173,16 +3775,15 @@ class ScenarioEditorApp:
             self.oob_map_filename_var.set("")
             return
 
-        if self.map_file_path and self.map_file_path.resolve() == path.resolve():
+        if self.map_file_path and (
+            path == self.map_file_path or path.resolve() == self._resolved_map_path
+        ):
             return
 
         self.load_map_file(path)
 
-    def _build_gxl_tab(self, filename: str, tab_name: str) -> None:
-        """Build a tab for browsing PCX images in a GXL archive."""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text=f"{tab_name} ({filename})")
-
+    def _build_gxl_tab(self, frame: ttk.Frame, filename: str) -> None:
+        """Build the contents of a tab for browsing PCX images in a GXL archive."""
         frame.columnconfigure(0, weight=0, minsize=200)
         frame.columnconfigure(1, weight=1)
         frame.rowconfigure(1, weight=1)
@@ -3239,44 +3840,77 @@ class ScenarioEditorApp:
             entries = load_gxl_archive(gxl_path)
             status_var.set(f"Loaded {len(entries)} entries from {filename}")
 
-            # Store data for this tab
-            photo_cache: Dict[int, ImageTk.PhotoImage] = {}
+            # Content digests per list index, computed on first selection;
+            # the shared photo cache is keyed on these so identical images
+            # (and revisited tabs) resolve to one decode.
+            entry_digests: Dict[int, bytes] = {}
 
-            for entry in entries:
-                listbox.insert(tk.END, f"{entry.name} ({entry.size} bytes)")
+            def entry_key(idx: int) -> bytes:
+                key = entry_digests.get(idx)
+                if key is None:
+                    key = hashlib.blake2b(entries[idx].data, digest_size=16).digest()
+                    entry_digests[idx] = key
+                return key
 
-            def on_select(*_args):
+            self._fast_listbox_replace(
+                listbox, [f"{entry.name} ({entry.size} bytes)" for entry in entries]
+            )
+
+            def show_photo(photo: ImageTk.PhotoImage, info: str) -> None:
+                info_var.set(info)
+                canvas.delete("all")
+                canvas.create_image(0, 0, anchor=tk.NW, image=photo)
+                canvas.configure(scrollregion=canvas.bbox("all"))
+
+                # Keep reference
+                canvas.image = photo  # type: ignore
+
+            def apply_image(idx: int, img: Image.Image) -> None:
+                # Main thread again; drop the result if the user has moved on
+                # to another entry meanwhile.
                 selection = listbox.curselection()
-                if not selection:
+                if not selection or selection[0] != idx:
                     return
-                idx = selection[0]
                 entry = entries[idx]
+                photo = ImageTk.PhotoImage(img)
+                cache = self.gxl_photo_cache
+                cache[entry_key(idx)] = (photo, img.size[0], img.size[1], img.mode)
+                while len(cache) > 32:
+                    cache.popitem(last=False)
+                show_photo(photo, f"{entry.name}: {img.size[0]}×{img.size[1]}, {img.mode}")
+
+            def apply_error(idx: int, exc: Exception) -> None:
+                selection = listbox.curselection()
+                if not selection or selection[0] != idx:
+                    return
+                info_var.set(f"{entries[idx].name}: Unable to display ({exc})")
+                canvas.delete("all")
 
-                # Try to load as PCX
+            def decode_entry(idx: int) -> None:
+                # Worker thread: decode only. Tk objects must be created on
+                # the main thread, so hand the PIL image back via after().
                 try:
-                    from PIL import Image
-                    import io
-
-                    img = Image.open(io.BytesIO(entry.data))
-                    info_var.set(f"{entry.name}: {img.size[0]}×{img.size[1]}, {img.mode}")
-
-                    # Cache photo
-                    if idx not in photo_cache:
-                        photo_cache[idx] = ImageTk.PhotoImage(img)
-
-                    photo = photo_cache[idx]
-
-                    # Update canvas
-                    canvas.delete("all")
-                    canvas.create_image(0, 0, anchor=tk.NW, image=photo)
-                    canvas.configure(scrollregion=canvas.bbox("all"))
-
-                    # Keep reference
-                    canvas.image = photo  # type: ignore
-
+                    img = Image.open(io.BytesIO(entries[idx].data))
+                    img.load()
                 except Exception as exc:
-                    info_var.set(f"{entry.name}: Unable to display ({exc})")
-                    canvas.delete("all")
+                    self.root.after(0, apply_error, idx, exc)
+                else:
+                    self.root.after(0, apply_image, idx, img)
+
+            def on_select(*_args):
+                selection = listbox.curselection()
+                if not selection:
+                    return
+                idx = selection[0]
+                key = entry_key(idx)
+                cached = self.gxl_photo_cache.get(key)
+                if cached is not None:
+                    self.gxl_photo_cache.move_to_end(key)
+                    photo, width, height, mode = cached
+                    show_photo(photo, f"{entries[idx].name}: {width}×{height}, {mode}")
+                    return
+                info_var.set(f"{entries[idx].name}: loading…")
+                self._image_executor.submit(decode_entry, idx)
 
             listbox.bind("<<ListboxSelect>>", on_select)
 
@@ -3290,10 +3924,9 @@ class ScenarioEditorApp:
 
 
 def re_sub_region_code(text: str, new_code: str) -> str:
-    prefix = text
-    if "rp" in prefix:
-        start = prefix.index("rp")
-        return prefix[: start + 2] + new_code.upper() + prefix[start + 4 :]
+    head, sep, tail = text.partition("rp")
+    if sep:
+        return head + "rp" + new_code.upper() + tail[2:]
     return f"rp{new_code.upper()}"
 
 
@@ -17,11 +17,28 @@ def get_scenario(index):
         f.seek(index * SCENARIO_SIZE)
         return f.read(SCENARIO_SIZE)
 
+def find_markers(script):
+    """Return (has_0d, has_00, has_c0) player markers in one pass."""
+    has_0d = has_00 = has_c0 = False
+    for op, oper in script:
+        if op == 0x01:
+            if oper == 0x0d:
+                has_0d = True
+            elif oper == 0x00:
+                has_00 = True
+            elif oper == 0xc0:
+                has_c0 = True
+            if has_0d and has_00 and has_c0:
+                break
+    return has_0d, has_00, has_c0
+
 def analyze_all_scenarios():
     """Check turn counts and markers for all 24 scenarios."""
     print(f"{'Scenario':<10} {'Turn Count':<12} {'Has 0x0d':<10} {'Has 0x00':<10} {'Has 0xc0':<10} {'Script Len':<12}")
     print(f"{'='*10} {'='*12} {'='*10} {'='*10} {'='*10} {'='*12}")
 
+    markers = []
+
     for i in range(24):
         data = get_scenario(i)
         script = parse_objective_script(data)
@@ -30,9 +47,8 @@ def analyze_all_scenarios():
         turn_count = data[5761]
 
         # Check for player markers
-        has_0d = any(op == 0x01 and oper == 0x0d for op, oper in script)
-        has_00 = any(op == 0x01 and oper == 0x00 for op, oper in script)
-        has_c0 = any(op == 0x01 and oper == 0xc0 for op, oper in script)
+        has_0d, has_00, has_c0 = find_markers(script)
+        markers.append((has_0d, has_00, has_c0))
 
         print(f"{i:<10} {turn_count:<12} {str(has_0d):<10} {str(has_00):<10} {str(has_c0):<10} {len(script):<12}")
 
@@ -40,19 +56,12 @@ def analyze_all_scenarios():
     print("PATTERN ANALYSIS:")
     print(f"{'='*80}")
 
-    # Re-run with grouping
+    # Group from the markers collected above
     with_markers = []
     without_markers = []
     with_c0 = []
 
-    for i in range(24):
-        data = get_scenario(i)
-        script = parse_objective_script(data)
-
-        has_0d = any(op == 0x01 and oper == 0x0d for op, oper in script)
-        has_00 = any(op == 0x01 and oper == 0x00 for op, oper in script)
-        has_c0 = any(op == 0x01 and oper == 0xc0 for op, oper in script)
-
+    for i, (has_0d, has_00, has_c0) in enumerate(markers):
         if has_c0:
             with_c0.append(i)
         elif has_0d or has_00:
@@ -8,15 +8,27 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import re
 import struct
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
 
+from editor.data import read_file_buffer
 from editor.objectives import (
     OPCODE_MAP,
     SPECIAL_OPERANDS,
     parse_objective_script as shared_parse_objective_script,
 )
 
+# Dense opcode table: one index replaces the `in` test plus dict lookup per
+# word (same layout the editor uses). Entries are (mnemonic, operand label,
+# description) or None for unknown opcodes.
+_OPCODE_TABLE = tuple(OPCODE_MAP.get(code) for code in range(256))
+
+# Title heuristic: a printable byte, then everything up to the next NUL.
+# One C-level scan per candidate instead of a Python loop over every byte.
+_TITLE_RE = re.compile(rb"([\x20-\x7E][^\x00]*)\x00")
+
 
 def parse_scenario_script(block_data):
     """
@@ -28,10 +40,16 @@ def parse_scenario_script(block_data):
     return shared_parse_objective_script(block_data)
 
 
-def decode_opcode(opcode, operand, context=None):
-    """Decode a single opcode into human-readable form."""
-    if opcode in OPCODE_MAP:
-        mnemonic, _, description = OPCODE_MAP[opcode]
+@lru_cache(maxsize=4096)
+def decode_opcode(opcode, operand):
+    """Decode a single opcode into human-readable form.
+
+    Memoized: the same (opcode, operand) pairs repeat verbatim across
+    scenarios, so each is formatted once.
+    """
+    entry = _OPCODE_TABLE[opcode]
+    if entry is not None:
+        mnemonic, _, description = entry
         operand_str = SPECIAL_OPERANDS.get(operand, f"{operand}")
         return f"{mnemonic}({operand_str})", description
     else:
@@ -40,35 +58,32 @@ def decode_opcode(opcode, operand, context=None):
 
 def decode_script(script, scenario_title=""):
     """Decode an entire objective script into objectives."""
-    lines = []
-    lines.append(f"Scenario: {scenario_title}")
-    lines.append("=" * 70)
+    lines = [f"Scenario: {scenario_title}", "=" * 70]
 
     if not script:
         lines.append("  No objective script found")
         return "\n".join(lines)
 
     lines.append("\nRaw opcodes:")
-    for opcode, operand in script:
-        code_str, description = decode_opcode(opcode, operand)
-        lines.append(f"  0x{opcode:02x}({operand:3}) -> {code_str:20} // {description}")
+    # One bulk extend over the script instead of a method call per line.
+    lines.extend(
+        "  0x{:02x}({:3}) -> {:20} // {}".format(
+            opcode, operand, *decode_opcode(opcode, operand)
+        )
+        for opcode, operand in script
+    )
 
     # Attempt high-level interpretation
     lines.append("\nInterpreted objectives:")
 
-    i = 0
     current_player = None
-    while i < len(script):
-        opcode, operand = script[i]
-
+    for opcode, operand in script:
         if opcode == 0x01:  # TURNS - player objective delimiter
             if operand == 0x0d:
-                lines.append("")
-                lines.append("GREEN PLAYER OBJECTIVES:")
+                lines.extend(("", "GREEN PLAYER OBJECTIVES:"))
                 current_player = "Green"
             elif operand == 0x00:
-                lines.append("")
-                lines.append("RED PLAYER OBJECTIVES:")
+                lines.extend(("", "RED PLAYER OBJECTIVES:"))
                 current_player = "Red"
             elif operand == 0xfe:
                 lines.append("  • Duration: Until objectives complete")
@@ -108,29 +123,30 @@ def decode_script(script, scenario_title=""):
         elif opcode == 0x18:  # Convoy port
             lines.append(f"  • Convoy destination (port ref: {operand})")
 
-        elif opcode in OPCODE_MAP:
-            _, _, desc = OPCODE_MAP[opcode]
-            lines.append(f"  • {desc} (param: {operand})")
         else:
-            lines.append(f"  • Unknown: opcode 0x{opcode:02x}, operand {operand}")
-
-        i += 1
+            entry = _OPCODE_TABLE[opcode]
+            if entry is not None:
+                lines.append(f"  • {entry[2]} (param: {operand})")
+            else:
+                lines.append(f"  • Unknown: opcode 0x{opcode:02x}, operand {operand}")
 
     return "\n".join(lines)
 
 
 def load_all_scenarios(scenario_path):
     """Load all scenario records from SCENARIO.DAT."""
-    data = scenario_path.read_bytes()
+    # Map the file instead of copying it wholesale; the memoryview keeps the
+    # per-scenario slices below from duplicating the rest of the payload.
+    data = read_file_buffer(scenario_path)
     count = struct.unpack_from("<H", data, 0)[0]
 
-    payload = data[2:]
+    payload = memoryview(data)[2:]
     block_len = len(payload) // count
 
     scenarios = []
     for idx in range(count):
         start = idx * block_len
-        block = payload[start : start + block_len]
+        block = bytes(payload[start : start + block_len])
 
         # Extract title (first metadata string)
         title = f"Scenario {idx}"
@@ -142,14 +158,16 @@ def load_all_scenarios(scenario_path):
             ) + 200
 
             if meta_start > 200:
-                for i in range(meta_start, min(meta_start + 1000, len(block))):
-                    if block[i] >= 0x20 and block[i] < 0x7F:
-                        end = block.find(b'\x00', i)
-                        if end > i:
-                            candidate = block[i:end].decode('latin1', errors='ignore').strip()
-                            if len(candidate) > 5 and ' ' in candidate:
-                                title = candidate
-                                break
+                # Candidates must start inside the window, though the string
+                # itself may run past it (as the manual scan allowed).
+                window_end = min(meta_start + 1000, len(block))
+                for match in _TITLE_RE.finditer(block, meta_start):
+                    if match.start() >= window_end:
+                        break
+                    candidate = match.group(1).decode('latin1', errors='ignore').strip()
+                    if len(candidate) > 5 and ' ' in candidate:
+                        title = candidate
+                        break
         except:
             pass
 
@@ -167,13 +185,16 @@ def load_all_scenarios(scenario_path):
 
 def analyze_opcode_usage(scenarios):
     """Analyze opcode patterns across all scenarios."""
-    opcode_freq = defaultdict(int)
+    # Counter does its tallying in C (_count_elements), so bulk updates beat
+    # a += 1 dict dance per opcode in the Python loop.
+    opcode_freq = Counter()
     opcode_operands = defaultdict(list)
-    position_map = defaultdict(lambda: defaultdict(int))
+    position_map = defaultdict(Counter)
 
     for scenario in scenarios:
-        for pos, (opcode, operand) in enumerate(scenario['script']):
-            opcode_freq[opcode] += 1
+        script = scenario['script']
+        opcode_freq.update(opcode for opcode, _ in script)
+        for pos, (opcode, operand) in enumerate(script):
             opcode_operands[opcode].append(operand)
             position_map[pos][opcode] += 1
 
@@ -200,11 +221,14 @@ def main():
     # Load all scenarios
     scenarios = load_all_scenarios(scenario_path)
 
-    # Decode each one
+    # Decode each one, collecting the output so stdout is written (and, on
+    # a line-buffered TTY, flushed) once instead of per scenario
+    out = []
     for scenario in scenarios[:10]:  # First 10 scenarios
         if scenario['script']:
-            print(decode_script(scenario['script'], scenario['title']))
-            print()
+            out.append(decode_script(scenario['script'], scenario['title']))
+            out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Statistical analysis
     print("\n" + "=" * 80)
@@ -16,13 +16,29 @@ import struct
 import sys
 from pathlib import Path
 from collections import Counter
-from typing import Dict, Iterable, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from editor.data import load_template_library
+from editor.data import TemplateRecord, load_template_library, read_file_buffer
 
 REGION_RECORD_LEN = 65  # observed constant across the scenario *.DAT files
+PRINTABLE_BYTES = bytes(range(0x20, 0x7F))  # for C-level printable counting
+
+# Compiled once; these formats run in loops over every record and section.
+_WORD = struct.Struct("<H")
+_PAIR = struct.Struct("<HH")
+_REGION_TAIL = struct.Struct("<16H")
+_UNIT_FRAME = struct.Struct("<8H")  # only the first 8 of 16 words are used
+
+# Likewise for the patterns applied per record, per section, and per field.
+_PRINTABLE3_RE = re.compile(rb"[ -~]{3,}")
+_PRINTABLE4_RE = re.compile(rb"[ -~]{4,}")
+_RP_CODE_RE = re.compile(r"rp([A-Z0-9]{2})")
+# A maximal printable run that is purely alphabetic once stripped: the
+# lookarounds pin both ends of the run so partial runs never match.
+_SCENARIO_KEY_RE = re.compile(rb"(?<![ -~]) *([A-Za-z]+) *(?![ -~])")
 SCENARIO_TEXT_ENCODING = "latin1"  # Turbo Pascal wrote raw bytes; latin1 preserves them
 UNIT_POINTER_MAP = {5: "air", 8: "surface", 11: "sub"}
 PCX_PANEL_OFFSETS = {0: (184, 0), 1: (48, 8)}
@@ -30,7 +46,7 @@ PCX_PANEL_OFFSETS = {0: (184, 0), 1: (48, 8)}
 
 def read_word(data: bytes, offset: int) -> Tuple[int, int]:
     """Return little-endian word at offset and the new offset."""
-    value = struct.unpack_from("<H", data, offset)[0]
+    value = _WORD.unpack_from(data, offset)[0]
     return value, offset + 2
 
 
@@ -49,7 +65,7 @@ def chunk_pairs(data: bytes, offset: int, count: int) -> List[Tuple[int, int]]:
         start = offset + idx * 4
         if start + 4 > len(data):
             break
-        pairs.append(struct.unpack_from("<HH", data, start))
+        pairs.append(_PAIR.unpack_from(data, start))
     return pairs
 
 
@@ -100,24 +116,31 @@ def parse_scenario_record(blob: bytes, index: int) -> Dict[str, object]:
         record["notes"] = ""
         record["parse_warning"] = "SPECIAL NOTES marker missing"
 
-    # SECTION 2: metadata strings up until the binary payload.
-    metadata_strings: List[str] = []
+    # SECTION 2: metadata strings up until the binary payload. One split on
+    # NUL tokenizes everything in a single C pass instead of a per-string
+    # scan loop; binary data kicks in at the first token that *starts* with
+    # a control character (<0x20) — strings may contain control bytes
+    # mid-token, so the test must not look inside them.
     remainder = remainder.lstrip(b"\x00")
-    while remainder:
-        # Binary data kicks in once we hit a control character (<0x20).
-        if remainder[0] < 0x20:
-            break
-        meta_bytes, rel = read_cstring_bytes(remainder, 0)
-        metadata_strings.append(
-            meta_bytes.decode(SCENARIO_TEXT_ENCODING, errors="replace")
-        )
-        remainder = remainder[rel:].lstrip(b"\x00")
+    metadata_strings: List[str] = []
+    binary_start = 0
+    for token in remainder.split(b"\x00"):
+        if token:
+            if token[0] < 0x20:
+                break
+            metadata_strings.append(
+                token.decode(SCENARIO_TEXT_ENCODING, errors="replace")
+            )
+        binary_start += len(token) + 1
+    else:
+        binary_start = len(remainder)
+    remainder = remainder[binary_start:]
 
     record["metadata_strings"] = metadata_strings
 
     # Everything else is preserved verbatim, but we also surface any embedded
     # printable strings to make hunting for parameters easier.
-    printable_sequences = re.findall(rb"[ -~]{3,}", remainder)
+    printable_sequences = _PRINTABLE3_RE.findall(remainder)
     record["printable_sequences"] = [
         seq.decode(SCENARIO_TEXT_ENCODING, errors="replace")
         for seq in printable_sequences
@@ -127,12 +150,14 @@ def parse_scenario_record(blob: bytes, index: int) -> Dict[str, object]:
     )
 
     scenario_key = None
-    for seq in record["printable_sequences"]:
-        candidate = seq.strip()
-        if not candidate or candidate.startswith(")") or candidate.startswith("n-"):
-            continue
-        if candidate.isalpha():
-            scenario_key = candidate
+    # One C-level regex scan over the payload replaces the Python walk of
+    # strip()/startswith()/isalpha() checks per printable sequence. The run
+    # itself must still be at least three bytes, matching _PRINTABLE3_RE.
+    for match in _SCENARIO_KEY_RE.finditer(remainder):
+        if len(match.group(0)) >= 3:
+            scenario_key = match.group(1).decode(
+                SCENARIO_TEXT_ENCODING, errors="replace"
+            )
             break
     if not scenario_key:
         for meta in metadata_strings[1:]:
@@ -148,20 +173,31 @@ def parse_scenario_record(blob: bytes, index: int) -> Dict[str, object]:
     return record
 
 
-def parse_scenario_file(path: Path) -> List[Dict[str, object]]:
-    """Load SCENARIO.DAT and decode its ten fixed-size blocks."""
-    data = path.read_bytes()
+def iter_scenario_records(path: Path) -> Iterator[Dict[str, object]]:
+    """Lazily decode SCENARIO.DAT's fixed-size blocks, one record at a time."""
+    # Mapped, not copied; the memoryview keeps the per-block slices from
+    # duplicating the remainder of the payload each iteration.
+    data = read_file_buffer(path)
     count, offset = read_word(data, 0)
     if count == 0:
-        return []
+        return
 
-    payload = data[offset:]
+    payload = memoryview(data)[offset:]
     block_len = len(payload) // count
-    records = []
     for idx in range(count):
         start = idx * block_len
-        records.append(parse_scenario_record(payload[start : start + block_len], idx))
-    return records
+        yield parse_scenario_record(bytes(payload[start : start + block_len]), idx)
+
+
+def parse_scenario_file(path: Path) -> List[Dict[str, object]]:
+    """Load SCENARIO.DAT and decode its ten fixed-size blocks."""
+    return list(iter_scenario_records(path))
+
+
+@lru_cache(maxsize=8)
+def _cached_template_library(dir_str: str) -> Dict[str, List[TemplateRecord]]:
+    """Memoize template parsing per directory for multi-map runs."""
+    return load_template_library(Path(dir_str))
 
 
 def parse_region_block(block: bytes, index: int) -> Dict[str, object]:
@@ -174,23 +210,31 @@ def parse_region_block(block: bytes, index: int) -> Dict[str, object]:
 
     # Remaining zero-terminated fields contain control codes, adjacency strings,
     # and optional file references. We capture them verbatim and expose helper
-    # renders for strings that are obviously ASCII.
+    # renders for strings that are obviously ASCII. One C-level split does the
+    # tokenizing instead of a Python loop of per-field NUL scans.
     fields: List[Dict[str, object]] = []
-    while offset < len(block):
-        if len(block) - offset <= 32:
-            break
-        field_raw, offset = read_cstring_bytes(block, offset)
-        fields.append(
+    boundary = len(block) - 32
+    if offset < boundary:
+        field_bytes = block[offset:boundary]
+        parts = field_bytes.split(b"\x00")
+        if field_bytes.endswith(b"\x00"):
+            parts.pop()  # artifact of splitting on the final terminator
+        else:
+            # The last field has no terminator before the 32-byte tail; the
+            # per-field scan let it run into the tail, so mirror that here.
+            parts[-1], _ = read_cstring_bytes(block, boundary - len(parts[-1]))
+        fields = [
             {
                 "raw_hex": field_raw.hex(),
                 "text": field_raw.decode(SCENARIO_TEXT_ENCODING, errors="replace"),
             }
-        )
+            for field_raw in parts
+        ]
 
     region["fields"] = fields
 
     tail = block[-32:]
-    tail_words = list(struct.unpack("<16H", tail))
+    tail_words = list(_REGION_TAIL.unpack(tail))
     region["tail_words"] = tail_words
     label_bytes = tail[:10].rstrip(b"\x00")
     label_text = label_bytes.decode(SCENARIO_TEXT_ENCODING, errors="replace")
@@ -250,7 +294,7 @@ def parse_map_file(path: Path) -> Dict[str, object]:
     for region in regions:
         code = None
         for field in region["fields"]:
-            match = re.search(r"rp([A-Z0-9]{2})", field["text"])
+            match = _RP_CODE_RE.search(field["text"])
             if match:
                 code = match.group(1)
                 break
@@ -272,16 +316,19 @@ def parse_map_file(path: Path) -> Dict[str, object]:
         for idx, (start, _count) in enumerate(pointer_pairs)
     )
 
+    # abs_entries is sorted, so one backwards pass can carry the nearest
+    # strictly larger offset along (entries sharing an offset all see the
+    # same successor) instead of rescanning the tail for every entry.
     next_offset_lookup: Dict[int, int] = {}
-    for position, (abs_offset, idx) in enumerate(abs_entries):
-        next_abs = len(data)
-        for future_abs, _future_idx in abs_entries[position + 1 :]:
-            if future_abs > abs_offset:
-                next_abs = future_abs
-                break
-        next_offset_lookup[idx] = next_abs
+    next_greater = len(data)
+    prev_offset: Optional[int] = None
+    for abs_offset, idx in reversed(abs_entries):
+        if prev_offset is not None and prev_offset > abs_offset:
+            next_greater = prev_offset
+        next_offset_lookup[idx] = next_greater
+        prev_offset = abs_offset
 
-    template_library = load_template_library(path.parent)
+    template_library = _cached_template_library(str(path.parent.resolve()))
 
     pointer_table: List[Dict[str, object]] = []
     sections: List[Dict[str, object]] = []
@@ -309,9 +356,11 @@ def parse_map_file(path: Path) -> Dict[str, object]:
 
         ascii_sequences = [
             seq.decode(SCENARIO_TEXT_ENCODING, errors="replace")
-            for seq in re.findall(rb"[ -~]{4,}", chunk)
+            for seq in _PRINTABLE4_RE.findall(chunk)
         ]
-        ascii_ratio = sum(1 for b in chunk if 32 <= b < 127) / len(chunk)
+        # Deleting the printable range counts the rest in one C pass instead
+        # of a per-byte generator scan.
+        ascii_ratio = (len(chunk) - len(chunk.translate(None, PRINTABLE_BYTES))) / len(chunk)
         classification = "raw_bytes"
         preview: Dict[str, object] = {}
 
@@ -322,9 +371,10 @@ def parse_map_file(path: Path) -> Dict[str, object]:
             frame_size = 32
             frames = len(chunk) // frame_size
             units: List[Dict[str, object]] = []
+            # Decode only the 8 words the record below actually uses; the
+            # back half of each 32-byte frame never leaves this loop.
             for slot in range(frames):
-                frame = chunk[slot * frame_size : (slot + 1) * frame_size]
-                words = struct.unpack("<16H", frame)
+                words = _UNIT_FRAME.unpack_from(chunk, slot * frame_size)
                 template_id = words[0] & 0xFF
                 owner_raw = words[0] >> 8
                 if template_id >= len(templates):
@@ -344,7 +394,7 @@ def parse_map_file(path: Path) -> Dict[str, object]:
                         "region_name": region_name,
                         "tile_x": words[2],
                         "tile_y": words[3],
-                        "raw_words": words[:8],
+                        "raw_words": words,
                     }
                 )
             unit_tables[kind] = units
@@ -515,10 +565,13 @@ def main() -> None:
     output: Dict[str, object] = {}
 
     if args.scenario:
-        records = parse_scenario_file(args.scenario)
-        output["scenario_records"] = records
-        if not args.json:
-            print(summarise_scenarios(records))
+        if args.json:
+            output["scenario_records"] = parse_scenario_file(args.scenario)
+        else:
+            # Stream: summarise each record as it is decoded instead of
+            # holding every block's parse in memory at once.
+            for record in iter_scenario_records(args.scenario):
+                print(summarise_scenarios([record]))
 
     if args.map:
         map_info = parse_map_file(args.map)
@@ -527,7 +580,10 @@ def main() -> None:
             print(summarise_map(map_info))
 
     if args.json:
-        print(json.dumps(output, indent=2))
+        # Stream the encoder straight to stdout rather than materializing
+        # the whole dump as one string first.
+        json.dump(output, sys.stdout, indent=2)
+        sys.stdout.write("\n")
 
 if __name__ == "__main__":
     main()
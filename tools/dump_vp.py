@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Iterable
 
@@ -14,8 +15,12 @@ from editor.data import TemplateRecord, load_template_library
 
 
 def _format_rows(records: Iterable[TemplateRecord]) -> str:
+    # Decorate-sort: build each (vp, lowercase name) key up front and let
+    # the C-level itemgetter drive the sort instead of a Python lambda.
+    decorated = [((rec.victory_points or -1, rec.name.lower()), rec) for rec in records]
+    decorated.sort(key=itemgetter(0))
     lines = []
-    for rec in sorted(records, key=lambda r: (r.victory_points or -1, r.name.lower())):
+    for _, rec in decorated:
         vp = rec.victory_points if rec.victory_points is not None else "?"
         lines.append(f"  {rec.name:<24} {vp}")
     return "\n".join(lines)
@@ -4,17 +4,52 @@ Comprehensive investigation of objective parsing issue for Scenario 1.
 This script analyzes the binary data to understand what information is available.
 """
 
+import re
 import struct
 import sys
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 # Import existing parsing functions
-from editor.data import ScenarioFile, MapFile, SCENARIO_TEXT_ENCODING
+from editor.data import ScenarioFile, MapFile, SCENARIO_TEXT_ENCODING, read_file_buffer
 from editor.objectives import parse_objective_script, OPCODE_MAP, SPECIAL_OPERANDS
 
+# Characters (latin1, so byte == character) that count as printable content
+# in a string segment — NUL and 0xff excluded. A small lookup set keeps the
+# segment filter to one isdisjoint call instead of per-character methods.
+_PRINTABLE_SEG_CHARS = frozenset(
+    chr(value) for value in range(256)
+    if chr(value).isprintable() and value not in (0x00, 0xFF)
+)
+
+# Hex-dump ASCII column: printable bytes pass through, everything else
+# becomes '.'; bytes.translate renders a whole row in one C call.
+_ASCII_DUMP_TABLE = bytes(value if 32 <= value < 127 else 0x2E for value in range(256))
+
+
+def find_first_occurrences(blob: bytes, terms: List[bytes]) -> Dict[bytes, int]:
+    """Locate the first offset of every term in a single pass over blob.
+
+    A zero-width lookahead alternation visits each position where *any* term
+    starts; testing the still-pending terms there keeps overlapping needles
+    (e.g. 'Male' inside 'Male Atoll') exact while scanning the haystack once
+    instead of once per term.
+    """
+    pattern = re.compile(b"(?=(" + b"|".join(re.escape(term) for term in terms) + b"))")
+    pending = set(terms)
+    first: Dict[bytes, int] = {}
+    for match in pattern.finditer(blob):
+        pos = match.start()
+        # Slice comparison rather than startswith so mmap buffers work too.
+        for term in [term for term in pending if blob[pos:pos + len(term)] == term]:
+            first[term] = pos
+            pending.discard(term)
+        if not pending:
+            break
+    return first
+
 
 def print_section(title: str):
     """Print a formatted section header"""
@@ -49,7 +84,10 @@ def analyze_scenario_1():
     # =========================================================================
     print_section("TASK 1: Loading Scenario 1 from SCENARIO.DAT")
 
-    scenario_file = ScenarioFile.load(scenario_path)
+    # Map the file once; TASK 6's raw byte scans reuse the same buffer
+    # instead of reading the file a second time.
+    raw_data = read_file_buffer(scenario_path)
+    scenario_file = ScenarioFile.load_from_buffer(raw_data, path=scenario_path)
     scenario_1 = scenario_file.records[0]  # Index 0 = Scenario 1
 
     print(f"Scenario Index: {scenario_1.index}")
@@ -107,32 +145,15 @@ def analyze_scenario_1():
         print(f"  Count: {ptr_9.count}")
         print(f"  Length: {ptr_9.length} bytes")
 
-        # Extract all null-terminated strings from section 9
-        data = ptr_9.data
+        # Extract all null-terminated strings from section 9. The whole
+        # section is decoded once (latin1 is single-byte, so bytes and
+        # characters line up) and tokenized with a single split; segments
+        # are screened against the printable lookup set.
+        text_all = ptr_9.data.decode(SCENARIO_TEXT_ENCODING, errors='replace')
         strings = []
-        i = 0
-        while i < len(data):
-            if data[i] == 0:
-                i += 1
-                continue
-
-            # Find the null terminator
-            end = data.find(b'\x00', i)
-            if end == -1:
-                end = len(data)
-
-            segment = data[i:end]
-
-            # Try to decode as string
-            try:
-                text = segment.decode(SCENARIO_TEXT_ENCODING, errors='replace')
-                # Only include if it has printable characters
-                if any(c.isprintable() and c not in '\x00\xff' for c in text):
-                    strings.append((len(strings), text))
-            except:
-                pass
-
-            i = end + 1
+        for segment in text_all.split('\x00'):
+            if segment and not _PRINTABLE_SEG_CHARS.isdisjoint(segment):
+                strings.append((len(strings), segment))
 
         print(f"\nAll null-terminated strings in pointer section 9 ({len(strings)} total):")
         for idx, text in strings[:20]:  # Show first 20
@@ -160,16 +181,19 @@ def analyze_scenario_1():
     print(f"\nScenario 1 trailing_bytes length: {len(scenario_1.trailing_bytes)}")
     print(f"Trailing bytes (hex):")
     for i in range(0, min(len(scenario_1.trailing_bytes), 80), 16):
-        hex_bytes = ' '.join(f'{b:02x}' for b in scenario_1.trailing_bytes[i:i+16])
-        ascii_repr = ''.join(chr(b) if 32 <= b < 127 else '.' for b in scenario_1.trailing_bytes[i:i+16])
+        chunk = scenario_1.trailing_bytes[i:i+16]
+        hex_bytes = chunk.hex(' ')
+        ascii_repr = chunk.translate(_ASCII_DUMP_TABLE).decode('latin1')
         print(f"  [{i:3}] {hex_bytes:48}  {ascii_repr}")
 
-    # Look for byte 24 (0x18) in trailing bytes
+    # Look for byte 24 (0x18) in trailing bytes. bytes.find hops between
+    # hits at memchr speed instead of enumerating every byte in Python.
     print(f"\nSearching for byte value 24 (0x18) in trailing_bytes:")
-    for i, byte in enumerate(scenario_1.trailing_bytes):
-        if byte == 24:
-            context = scenario_1.trailing_bytes[max(0, i-5):i+6]
-            print(f"  Found at offset {i}: context = {context.hex()}")
+    i = scenario_1.trailing_bytes.find(24)
+    while i != -1:
+        context = scenario_1.trailing_bytes[max(0, i-5):i+6]
+        print(f"  Found at offset {i}: context = {context.hex()}")
+        i = scenario_1.trailing_bytes.find(24, i + 1)
 
     # =========================================================================
     # TASK 5: Analyze SPECIAL_RULE 0x06 (convoy delivery active)
@@ -180,17 +204,31 @@ def analyze_scenario_1():
     print("This is a flag that tells the game engine to check for convoy delivery objectives.")
     print("\nSearching for ship names 'Antares' and 'Capella' in the map file...")
 
-    # Search all pointer sections for ship names
+    # Search all pointer sections for ship names — each section is upper-
+    # cased once and scanned per name, and the exact-case variant at every
+    # hit offset is read back from the original bytes, so the six per-variant
+    # probes collapse to two scans.
+    antares_variants = [b'Antares', b'ANTARES', b'antares']
+    capella_variants = [b'Capella', b'CAPELLA', b'capella']
     found_antares = False
     found_capella = False
 
     for ptr_idx, ptr in enumerate(map_file.pointer_entries):
         data = ptr.data
-        if b'Antares' in data or b'ANTARES' in data or b'antares' in data:
+        upper = data.upper()
+        hits = {}
+        for name_upper in (b'ANTARES', b'CAPELLA'):
+            pos = upper.find(name_upper)
+            while pos != -1:
+                variant = bytes(data[pos:pos + len(name_upper)])
+                hits.setdefault(variant, pos)
+                pos = upper.find(name_upper, pos + 1)
+
+        if any(variant in hits for variant in antares_variants):
             print(f"\n  Found 'Antares' reference in pointer section {ptr_idx}")
             # Extract context
-            for variant in [b'Antares', b'ANTARES', b'antares']:
-                pos = data.find(variant)
+            for variant in antares_variants:
+                pos = hits.get(variant, -1)
                 if pos >= 0:
                     context_start = max(0, pos - 20)
                     context_end = min(len(data), pos + 30)
@@ -198,10 +236,10 @@ def analyze_scenario_1():
                     print(f"    Context: {context}")
                     found_antares = True
 
-        if b'Capella' in data or b'CAPELLA' in data or b'capella' in data:
+        if any(variant in hits for variant in capella_variants):
             print(f"\n  Found 'Capella' reference in pointer section {ptr_idx}")
-            for variant in [b'Capella', b'CAPELLA', b'capella']:
-                pos = data.find(variant)
+            for variant in capella_variants:
+                pos = hits.get(variant, -1)
                 if pos >= 0:
                     context_start = max(0, pos - 20)
                     context_end = min(len(data), pos + 30)
@@ -234,9 +272,7 @@ def analyze_scenario_1():
 
     print("\nSearching SCENARIO.DAT for text like 'Antares', 'Capella', 'Male Atoll'...")
 
-    # Read raw scenario data
-    raw_data = scenario_path.read_bytes()
-
+    # Raw scenario data: reuse the buffer mapped in TASK 1.
     search_terms = [
         b'Antares', b'ANTARES',
         b'Capella', b'CAPELLA',
@@ -245,8 +281,9 @@ def analyze_scenario_1():
         b'fast convoy', b'Fast Convoy', b'FC'
     ]
 
+    scenario_hits = find_first_occurrences(raw_data, search_terms)
     for term in search_terms:
-        pos = raw_data.find(term)
+        pos = scenario_hits.get(term, -1)
         if pos >= 0:
             # Extract context
             context_start = max(0, pos - 50)
@@ -262,10 +299,11 @@ def analyze_scenario_1():
                 print(f"\n  Found '{term.decode()}' at offset {pos} (binary context)")
 
     print("\n\nSearching MAP file (MALDIVE.DAT) for these terms...")
-    map_raw = map_path.read_bytes()
+    map_raw = read_file_buffer(map_path)
 
+    map_hits = find_first_occurrences(map_raw, search_terms)
     for term in search_terms:
-        pos = map_raw.find(term)
+        pos = map_hits.get(term, -1)
         if pos >= 0:
             context_start = max(0, pos - 50)
             context_end = min(len(map_raw), pos + 50)
@@ -6,16 +6,20 @@ from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent))
+from editor.data import read_file_buffer
 from editor.objectives import parse_objective_script, OPCODE_MAP
 
 SCENARIO_DAT = Path(__file__).parent / "game" / "SCENARIO.DAT"
 SCENARIO_SIZE = 5883
 
+_scenario_blob = None
+
 def get_scenario(index):
-    """Read a specific scenario from SCENARIO.DAT."""
-    with open(SCENARIO_DAT, 'rb') as f:
-        f.seek(index * SCENARIO_SIZE)
-        return f.read(SCENARIO_SIZE)
+    """Slice a specific scenario out of SCENARIO.DAT, mapped once per run."""
+    global _scenario_blob
+    if _scenario_blob is None:
+        _scenario_blob = read_file_buffer(SCENARIO_DAT)
+    return bytes(_scenario_blob[index * SCENARIO_SIZE:(index + 1) * SCENARIO_SIZE])
 
 def analyze_special_scenario(scenario_num):
     """Detailed analysis of a specific scenario."""
@@ -5,69 +5,65 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
+from editor.data import read_file_buffer
 from editor.objectives import parse_objective_script, OPCODE_MAP
 
 SCENARIO_DAT = Path(__file__).parent / "game" / "SCENARIO.DAT"
 SCENARIO_SIZE = 5883
 
+_scenario_blob = None
+
 def get_scenario(index):
-    with open(SCENARIO_DAT, 'rb') as f:
-        f.seek(index * SCENARIO_SIZE)
-        return f.read(SCENARIO_SIZE)
+    """Slice a specific scenario out of SCENARIO.DAT, mapped once per run."""
+    global _scenario_blob
+    if _scenario_blob is None:
+        _scenario_blob = read_file_buffer(SCENARIO_DAT)
+    return bytes(_scenario_blob[index * SCENARIO_SIZE:(index + 1) * SCENARIO_SIZE])
+
+_UNK = ("UNK", "?", "?")
+
+# Parse every scenario exactly once up front; the group loops below only
+# index these lists.
+scripts = []
+names = []
+for i in range(24):
+    data = get_scenario(i)
+    scripts.append(parse_objective_script(data))
+    names.append(data[0:31].decode('ascii', errors='ignore').rstrip('\x00'))
+
+def classify(script):
+    """Assign a scenario to its structural group by opcode content."""
+    if any(op == 0x01 and oper == 0xc0 for op, oper in script):
+        return 4  # campaign marker
+    if any(op == 0x01 and oper in (0x0d, 0x00) for op, oper in script):
+        return 1  # explicit player sections
+    return 2 if len(script) == 4 else 3
+
+GROUP_TITLES = {
+    1: "GROUP 1: Scenarios WITH PLAYER_SECTION markers (0-4)",
+    2: "GROUP 2: Scenarios WITHOUT markers, 4 opcodes (5-10, 15-20, 23)",
+    3: "GROUP 3: Scenarios WITHOUT markers, 5-6 opcodes (8, 9, 11-13, 21-22)",
+    4: "GROUP 4: Campaign marker scenario (14)",
+}
+
+groups = {1: [], 2: [], 3: [], 4: []}
+for i, script in enumerate(scripts):
+    groups[classify(script)].append(i)
 
 print("="*100)
 print("COMPREHENSIVE SCENARIO STRUCTURE ANALYSIS")
 print("="*100)
 
-print("\nGROUP 1: Scenarios WITH PLAYER_SECTION markers (0-4)")
-print("-"*100)
-for i in range(5):
-    data = get_scenario(i)
-    script = parse_objective_script(data)
-    name = data[0:31].decode('ascii', errors='ignore').rstrip('\x00')
-
-    print(f"\nScenario {i}: {name[:25]}...")
-    for idx, (op, oper) in enumerate(script):
-        mnem = OPCODE_MAP.get(op, ("UNK", "?", "?"))[0]
-        print(f"  [{idx}] 0x{op:02x}({op:3d}) = {oper:3d}  {mnem:20s}")
-
-print("\n" + "="*100)
-print("\nGROUP 2: Scenarios WITHOUT markers, 4 opcodes (5-10, 15-20, 23)")
-print("-"*100)
-for i in [5, 6, 7, 10, 15, 16, 17, 18, 19, 20, 23]:
-    data = get_scenario(i)
-    script = parse_objective_script(data)
-    name = data[0:31].decode('ascii', errors='ignore').rstrip('\x00')
-
-    print(f"\nScenario {i}: {name[:25]}...")
-    for idx, (op, oper) in enumerate(script):
-        mnem = OPCODE_MAP.get(op, ("UNK", "?", "?"))[0]
-        print(f"  [{idx}] 0x{op:02x}({op:3d}) = {oper:3d}  {mnem:20s}")
-
-print("\n" + "="*100)
-print("\nGROUP 3: Scenarios WITHOUT markers, 5-6 opcodes (8, 9, 11-13, 21-22)")
-print("-"*100)
-for i in [8, 9, 11, 12, 13, 21, 22]:
-    data = get_scenario(i)
-    script = parse_objective_script(data)
-    name = data[0:31].decode('ascii', errors='ignore').rstrip('\x00')
-
-    print(f"\nScenario {i}: {name[:25]}...")
-    for idx, (op, oper) in enumerate(script):
-        mnem = OPCODE_MAP.get(op, ("UNK", "?", "?"))[0]
-        print(f"  [{idx}] 0x{op:02x}({op:3d}) = {oper:3d}  {mnem:20s}")
-
-print("\n" + "="*100)
-print("\nGROUP 4: Campaign marker scenario (14)")
-print("-"*100)
-data = get_scenario(14)
-script = parse_objective_script(data)
-name = data[0:31].decode('ascii', errors='ignore').rstrip('\x00')
-
-print(f"\nScenario 14: {name[:25]}...")
-for idx, (op, oper) in enumerate(script):
-    mnem = OPCODE_MAP.get(op, ("UNK", "?", "?"))[0]
-    print(f"  [{idx}] 0x{op:02x}({op:3d}) = {oper:3d}  {mnem:20s}")
+for group in (1, 2, 3, 4):
+    if group > 1:
+        print("\n" + "="*100)
+    print("\n" + GROUP_TITLES[group])
+    print("-"*100)
+    for i in groups[group]:
+        print(f"\nScenario {i}: {names[i][:25]}...")
+        for idx, (op, oper) in enumerate(scripts[i]):
+            mnem = OPCODE_MAP.get(op, _UNK)[0]
+            print(f"  [{idx}] 0x{op:02x}({op:3d}) = {oper:3d}  {mnem:20s}")
 
 print("\n" + "="*100)
 print("KEY INSIGHT:")
@@ -11,6 +11,57 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 from editor.data import ScenarioFile
 from editor.objectives import parse_objective_script, OPCODE_MAP, SPECIAL_OPERANDS
 
+_PLAYER_HEADERS = {
+    0x0d: "═══ GREEN PLAYER OBJECTIVES ═══",
+    0x00: "═══ RED PLAYER OBJECTIVES ═══",
+}
+
+_SPECIAL_RULE_TEXT = {
+    0xfe: "• Special: No cruise missile attacks allowed",
+    0x06: "• Special: Convoy delivery mission active",
+}
+
+
+def _handle_turns(operand):  # TURNS - player delimiter
+    header = _PLAYER_HEADERS.get(operand)
+    if header:
+        print()
+        print(header)
+
+
+def _handle_special_rule(operand):
+    text = _SPECIAL_RULE_TEXT.get(operand)
+    if text:
+        print(text)
+
+
+def _handle_base_rule(operand):
+    # In the actual editor, this will try to look up the base name
+    print(f"• Airfield/base objective (base ID: {operand})")
+    print("  [Note: Editor will look up base name from MAP.DAT pointer section 9]")
+
+
+def _handle_score(operand):
+    print(f"• Victory points objective (ref: {operand})")
+    print("  [This represents: 'Destroy as many enemy units as possible']")
+
+
+def _handle_end(operand):
+    if operand > 0:
+        print(f"• Victory check: region {operand}")
+        print("  [Note: Editor will look up region name from MAP.DAT]")
+
+
+# One dict lookup dispatches each opcode instead of walking an elif ladder.
+_OPCODE_HANDLERS = {
+    0x01: _handle_turns,
+    0x05: _handle_special_rule,
+    0x0e: _handle_base_rule,
+    0x03: _handle_score,
+    0x00: _handle_end,
+}
+
+
 def display_scenario_objectives(scenario_index: int = 0):
     """Display objectives as they will appear in the editor."""
     scenario_file = ScenarioFile.load(Path("game/SCENARIO.DAT"))
@@ -53,37 +104,13 @@ def display_scenario_objectives(scenario_index: int = 0):
 
     # Display opcodes
     for opcode, operand in script:
-        if opcode == 0x01:  # TURNS - player delimiter
-            if operand == 0x0d:
-                print()
-                print("═══ GREEN PLAYER OBJECTIVES ═══")
-            elif operand == 0x00:
-                print()
-                print("═══ RED PLAYER OBJECTIVES ═══")
-
-        elif opcode == 0x05:  # SPECIAL_RULE
-            if operand == 0xfe:
-                print("• Special: No cruise missile attacks allowed")
-            elif operand == 0x06:
-                print("• Special: Convoy delivery mission active")
-
-        elif opcode == 0x0e:  # BASE_RULE
-            # In the actual editor, this will try to look up the base name
-            print(f"• Airfield/base objective (base ID: {operand})")
-            print("  [Note: Editor will look up base name from MAP.DAT pointer section 9]")
-
-        elif opcode == 0x03:  # SCORE
-            print(f"• Victory points objective (ref: {operand})")
-            print("  [This represents: 'Destroy as many enemy units as possible']")
-
-        elif opcode == 0x00:  # END
-            if operand > 0:
-                print(f"• Victory check: region {operand}")
-                print("  [Note: Editor will look up region name from MAP.DAT]")
-
-        elif opcode in OPCODE_MAP:
-            mnemonic, _, description = OPCODE_MAP[opcode]
-            print(f"• {description} (param: {operand})")
+        handler = _OPCODE_HANDLERS.get(opcode)
+        if handler is not None:
+            handler(operand)
+        else:
+            entry = OPCODE_MAP.get(opcode)
+            if entry is not None:
+                print(f"• {entry[2]} (param: {operand})")
 
     print()
     print("=" * 80)
@@ -12,6 +12,23 @@ from PIL import Image, ImageDraw, ImageFont
 import sys
 
 
+def _marker_masks(size: int):
+    """Rasterize the disc and outline-ring masks for one marker size."""
+    box = [0, 0, 2 * size, 2 * size]
+    disc = Image.new("1", (2 * size + 1, 2 * size + 1), 0)
+    ImageDraw.Draw(disc).ellipse(box, fill=1)
+    ring = Image.new("1", (2 * size + 1, 2 * size + 1), 0)
+    ImageDraw.Draw(ring).ellipse(box, outline=1, width=1)
+    return disc, ring
+
+
+def _resolve_ink(image, color):
+    """Map an RGB tuple to the ink paste() expects for this image mode."""
+    if image.mode == "P":
+        return image.palette.getcolor(color, image)
+    return color
+
+
 def visualize_unit_placements(map_path: Path, output_path: Path):
     """Create a visualization of unit placements on the strategic map."""
 
@@ -27,8 +44,12 @@ def visualize_unit_placements(map_path: Path, output_path: Path):
     map_image = Image.open(mapver20_path)
     print(f"Loaded map: {map_image.size}")
 
-    # Create a copy for annotation
-    annotated = map_image.copy()
+    # Render at the viewing scale from the start: resampling the base map
+    # once up front means drawing and saving touch a quarter of the pixels,
+    # and the full-resolution resize at save time disappears.
+    scale = 0.5
+    small_size = (int(map_image.width * scale), int(map_image.height * scale))
+    annotated = map_image.resize(small_size, Image.LANCZOS)
     draw = ImageDraw.Draw(annotated)
 
     # Colors for each side
@@ -39,57 +60,63 @@ def visualize_unit_placements(map_path: Path, output_path: Path):
         3: (255, 255, 0),    # Yellow
     }
 
-    # Collect all valid units
-    unit_count = 0
+    # Pass 1: compute marker positions for every valid unit. Keeping the
+    # coordinate transform separate from the PIL calls means the draw loop
+    # below only touches units that survived filtering and bounds checks.
+    width, height = annotated.size
+    markers = []
     for kind in ['air', 'surface', 'sub']:
         if kind not in map_file.unit_tables:
             continue
 
-        units = [u for u in map_file.unit_tables[kind].units if u.region_index < 22]
-
-        for unit in units:
-            side = unit.owner_raw & 0x03
-            color = side_colors[side]
-            region = map_file.regions[unit.region_index]
+        size = 8 if kind == 'air' else 6
+        for unit in map_file.unit_tables[kind].units:
+            if unit.region_index >= 22:
+                continue
 
             # Try different coordinate interpretations
             word2 = unit.raw_words[2]
             word3 = unit.raw_words[3]
 
-            # Interpretation 1: If low byte is 0, use high byte as hex coordinate
+            # Interpretation 1: If low byte is 0, use high byte as hex coordinate.
+            # Scale to map (rough estimate - hex grid to pixel) assuming
+            # ~100 hexes across the map width.
             if (word2 & 0xFF) == 0 and (word3 & 0xFF) == 0:
                 x = word2 >> 8
                 y = word3 >> 8
-                # Scale to map (rough estimate - hex grid to pixel)
-                # Assuming ~100 hexes across the map width
-                pixel_x = int((x / 100) * map_image.width)
-                pixel_y = int((y / 100) * map_image.height)
-                marker_type = "hex"
-            else:
+            elif word2 < 200 and word3 < 200:  # Reasonable hex range
                 # Interpretation 2: Full word as coordinate
-                # These might already be pixel coordinates or need different scaling
                 x = word2
                 y = word3
+            else:
+                # Might be pixel coordinates or encoded differently
+                # Skip for now
+                continue
 
-                # Try as hex coordinates
-                if x < 200 and y < 200:  # Reasonable hex range
-                    pixel_x = int((x / 100) * map_image.width)
-                    pixel_y = int((y / 100) * map_image.height)
-                    marker_type = "small"
-                else:
-                    # Might be pixel coordinates or encoded differently
-                    # Skip for now
-                    continue
+            pixel_x = int((x / 100) * width)
+            pixel_y = int((y / 100) * height)
 
             # Bounds check
-            if 0 <= pixel_x < map_image.width and 0 <= pixel_y < map_image.height:
-                # Draw unit marker
-                size = 8 if kind == 'air' else 6
-                draw.ellipse([pixel_x-size, pixel_y-size, pixel_x+size, pixel_y+size],
-                           fill=color, outline=(255, 255, 255), width=1)
-                unit_count += 1
-
-    print(f"Plotted {unit_count} units")
+            if 0 <= pixel_x < width and 0 <= pixel_y < height:
+                markers.append((pixel_x, pixel_y, size, side_colors[unit.owner_raw & 0x03]))
+
+    # Pass 2: stamp the filtered markers. Every marker is a constant-radius
+    # circle in one of four colours, so each size's masks are rasterized once
+    # and pasted per unit instead of re-rendering the ellipse every call.
+    masks = {}
+    inks = {}
+    outline_ink = _resolve_ink(annotated, (255, 255, 255))
+    for pixel_x, pixel_y, size, color in markers:
+        if size not in masks:
+            masks[size] = _marker_masks(size)
+        if color not in inks:
+            inks[color] = _resolve_ink(annotated, color)
+        disc, ring = masks[size]
+        corner = (pixel_x - size, pixel_y - size)
+        annotated.paste(inks[color], corner, disc)
+        annotated.paste(outline_ink, corner, ring)
+
+    print(f"Plotted {len(markers)} units")
 
     # Add legend
     legend_x = 10
@@ -104,12 +131,8 @@ def visualize_unit_placements(map_path: Path, output_path: Path):
         draw.ellipse([legend_x+10, y, legend_x+18, y+8], fill=color, outline=(255, 255, 255))
         draw.text((legend_x+25, y), name, fill=(255, 255, 255))
 
-    # Save
-    # Scale down for viewing
-    scale = 0.5
-    small_size = (int(annotated.width * scale), int(annotated.height * scale))
-    annotated_small = annotated.resize(small_size, Image.LANCZOS)
-    annotated_small.save(output_path)
+    # Save — already at viewing scale.
+    annotated.save(output_path)
     print(f"Saved to {output_path}")
 
 